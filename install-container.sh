@@ -136,6 +136,10 @@ if [ -f "./src/main.py" ]; then
     print_section "📁 Installing Enhanced Application Files"
     print_status "Copying enhanced application to container..."
     cp -r ./src/* /opt/whisper-appliance/src/
+    # Vendor the Socket.IO client so the browser loads it same-origin instead of from a third-party CDN
+    mkdir -p /opt/whisper-appliance/src/static
+    wget -qO /opt/whisper-appliance/src/static/socket.io.min.js "https://cdn.socket.io/4.0.0/socket.io.min.js" || \
+        print_warning "⚠️  Socket.IO client download failed - live transcription will be unavailable"
     print_success "✅ Enhanced WhisperS2T application installed"
 else
     print_warning "⚠️  Enhanced app not found, downloading from GitHub..."
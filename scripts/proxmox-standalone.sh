@@ -517,6 +517,10 @@ download_file "https://raw.githubusercontent.com/GaboCapo/whisper-appliance/main
               "/opt/whisper-appliance/src/templates/main_interface.html" \
               "Main Interface Template"
 
+download_file "https://raw.githubusercontent.com/GaboCapo/whisper-appliance/main/src/templates/main_interface.js" \
+              "/opt/whisper-appliance/src/templates/main_interface.js" \
+              "Main Interface Script"
+
 # Download requirements from project root (not src/)
 download_file "https://raw.githubusercontent.com/GaboCapo/whisper-appliance/main/requirements.txt" \
               "/opt/whisper-appliance/requirements.txt" \
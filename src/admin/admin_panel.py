@@ -5,6 +5,8 @@ Modular admin interface with enhanced features
 
 import logging
 import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -37,9 +39,11 @@ class AdminPanel:
         self.model_manager = model_manager
         self.system_stats = system_stats or {
             "uptime_start": datetime.now(),
+            "uptime_start_monotonic": time.monotonic(),
             "total_transcriptions": 0,
             "transcriptions_by_source": {"live": 0, "upload": 0, "api": 0}
         }
+        self._stats_lock = threading.Lock()
 
         # Initialize sub-modules
         self.model_status = ModelStatusManager(model_manager)
@@ -248,9 +252,8 @@ class AdminPanel:
 
     def get_uptime_formatted(self):
         """Get formatted uptime string"""
-        if self.system_stats and "uptime_start" in self.system_stats:
-            uptime = datetime.now() - self.system_stats["uptime_start"]
-            total_seconds = int(uptime.total_seconds())
+        if self.system_stats and ("uptime_start_monotonic" in self.system_stats or "uptime_start" in self.system_stats):
+            total_seconds = self.system_monitor.get_uptime_seconds()
             
             days = total_seconds // 86400
             hours = (total_seconds % 86400) // 3600
@@ -270,11 +273,19 @@ class AdminPanel:
         return "Unknown"
     
     def increment_transcription_count(self, source="api"):
-        """Increment transcription counter"""
-        if self.system_stats:
-            self.system_stats["total_transcriptions"] += 1
-            if source in self.system_stats["transcriptions_by_source"]:
-                self.system_stats["transcriptions_by_source"][source] += 1
+        """Increment transcription counters - safe to call from concurrent request threads"""
+        if not self.system_stats:
+            return
+
+        with self._stats_lock:
+            # SystemStats guards its top-level counters; plain dicts rely on our lock
+            if hasattr(self.system_stats, "increment"):
+                self.system_stats.increment("total_transcriptions")
+            else:
+                self.system_stats["total_transcriptions"] = self.system_stats.get("total_transcriptions", 0) + 1
+            by_source = self.system_stats.get("transcriptions_by_source")
+            if by_source is not None and source in by_source:
+                by_source[source] += 1
 
 
 def init_admin_panel(app, blueprint, model_manager=None, system_stats=None): # Added blueprint parameter
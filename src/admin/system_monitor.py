@@ -7,6 +7,7 @@ import logging
 import os
 import platform
 import psutil
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,7 @@ class SystemMonitor:
     def __init__(self, system_stats=None):
         self.system_stats = system_stats or {
             "uptime_start": datetime.now(),
+            "uptime_start_monotonic": time.monotonic(),
             "total_transcriptions": 0,
             "transcriptions_by_source": {"live": 0, "upload": 0, "api": 0}
         }
@@ -106,6 +108,8 @@ class SystemMonitor:
     
     def get_uptime_seconds(self):
         """Get uptime in seconds"""
+        if "uptime_start_monotonic" in self.system_stats:
+            return int(time.monotonic() - self.system_stats["uptime_start_monotonic"])
         if "uptime_start" in self.system_stats:
             uptime = datetime.now() - self.system_stats["uptime_start"]
             return int(uptime.total_seconds())
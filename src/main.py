@@ -19,10 +19,14 @@ Main entry point with preserved functionality and enhanced architecture
 - Improved error handling and logging
 """
 
+import gzip
+import hashlib
 import logging
 import os
+import socket
 import sys
 import tempfile
+import time
 from datetime import datetime
 
 # CRITICAL: Add current directory to Python path for container compatibility
@@ -31,10 +35,11 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 # Flask and extensions
-from flask import Flask, jsonify, render_template, request, send_from_directory
+from flask import Flask, Response, jsonify, render_template, request, send_from_directory
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 from flask_swagger_ui import get_swaggerui_blueprint
+from werkzeug.serving import WSGIRequestHandler
 from werkzeug.utils import secure_filename
 
 # Import our modular components with error handling
@@ -47,7 +52,11 @@ try:
         ChatHistoryManager,
         LiveSpeechHandler,
         ModelManager,
+        SystemStats,
+        TranscriptionBatcher,
+        TranscriptionCache,
         UploadHandler,
+        warmup_audio_kernels,
     )
     from admin import init_admin_panel, admin_bp # Added for the new admin panel
 
@@ -60,6 +69,10 @@ except ImportError as e:
 try:
     from modules import UpdateManager, create_update_endpoints
 
+    # Optional subsystems resolve to None instead of raising
+    if UpdateManager is None or create_update_endpoints is None:
+        raise ImportError("modules.update could not be imported")
+
     UPDATE_MANAGER_IMPORTED = True
     print("✅ UpdateManager imported successfully")
 except ImportError as e:
@@ -72,6 +85,9 @@ except ImportError as e:
 try:
     from modules import EnterpriseMaintenanceManager
 
+    if EnterpriseMaintenanceManager is None:
+        raise ImportError("modules.maintenance could not be imported")
+
     ENTERPRISE_MAINTENANCE_IMPORTED = True
     print("✅ EnterpriseMaintenanceManager imported successfully")
 except ImportError as e:
@@ -83,6 +99,9 @@ except ImportError as e:
 try:
     from modules import MaintenanceManager
 
+    if MaintenanceManager is None:
+        raise ImportError("modules.maintenance could not be imported")
+
     MAINTENANCE_MANAGER_IMPORTED = True
     print("✅ MaintenanceManager imported successfully")
 except ImportError as e:
@@ -102,7 +121,18 @@ app.config["SECRET_KEY"] = "whisper-s2t-enhanced-secret-key"
 CORS(app)
 
 # Initialize SocketIO
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Pinned to threading: startup passes werkzeug-only options (ssl_context, request_handler), which
+# eventlet/gevent - installed in the container image - would otherwise be auto-selected and reject
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
+
+
+class NoDelayRequestHandler(WSGIRequestHandler):
+    """Request handler with Nagle disabled - small WebSocket frames (audio batches, results) go out immediately"""
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -119,7 +149,9 @@ else:
     logger.info("💡 Update functionality disabled")
 
 # System statistics and state
-system_stats = {"uptime_start": datetime.now(), "total_transcriptions": 0, "active_connections": 0}
+system_stats = SystemStats(
+    uptime_start=datetime.now(), uptime_start_monotonic=time.monotonic(), total_transcriptions=0, active_connections=0
+)
 connected_clients = []
 system_ready = True
 
@@ -137,7 +169,14 @@ else:
 
 # Initialize Model Manager and Chat History
 try:
-    model_manager = ModelManager()
+    # Persistent model cache (a volume in containers) so restarts skip the download
+    # WHISPER_TORCH_COMPILE=1 trades a slower first load for faster encoder passes
+    model_manager = ModelManager(
+        cache_dir=os.environ.get("WHISPER_CACHE_DIR"),
+        torch_compile=os.environ.get("WHISPER_TORCH_COMPILE", "0") == "1",
+        # WHISPER_QUANT=int8 opts into faster-whisper (CTranslate2) when it is installed
+        quantization=os.environ.get("WHISPER_QUANT") or None,
+    )
     chat_history = ChatHistoryManager()
 
     # Initialize Update Manager if available
@@ -161,7 +200,7 @@ WHISPER_AVAILABLE = False
 if model_manager:
     try:
         logger.info("Loading default Whisper model...")
-        if model_manager.load_model("base"):
+        if model_manager.load_model(os.environ.get("WHISPER_MODEL", "base")):
             WHISPER_AVAILABLE = True
             logger.info("✅ Whisper model loaded successfully")
         else:
@@ -173,10 +212,32 @@ if model_manager:
 else:
     logger.warning("⚠️ Model Manager not available")
 
+# Cache transcription results by audio content so repeated clips skip inference
+transcription_cache = TranscriptionCache(max_entries=256)
+
+# Coalesce concurrent short live speech chunks into batched Whisper decodes
+transcription_batcher = TranscriptionBatcher(model_manager, max_batch=8, max_wait_ms=10) if model_manager else None
+
 # Initialize module handlers with proper fallback handling
 try:
-    upload_handler = UploadHandler(model_manager, WHISPER_AVAILABLE, system_stats, chat_history)
-    live_speech_handler = LiveSpeechHandler(model_manager, WHISPER_AVAILABLE, system_stats, connected_clients, chat_history)
+    upload_handler = UploadHandler(
+        model_manager,
+        WHISPER_AVAILABLE,
+        system_stats,
+        chat_history,
+        transcription_cache=transcription_cache,
+    )
+    live_speech_handler = LiveSpeechHandler(
+        model_manager,
+        WHISPER_AVAILABLE,
+        system_stats,
+        connected_clients,
+        chat_history,
+        transcription_cache=transcription_cache,
+        batcher=transcription_batcher,
+        # WHISPER_SILENCE_RMS (e.g. 0.005) skips near-silent chunks; unset keeps every chunk
+        silence_rms_threshold=float(os.environ.get("WHISPER_SILENCE_RMS", 0)) or None,
+    )
 
     # Initialize the new Admin Panel using init_admin_panel
     # The old admin_panel instantiation is removed.
@@ -196,6 +257,9 @@ try:
         admin_panel_instance = None # Fallback
 
     api_docs = APIDocs(version="0.10.0")
+
+    # Compile the live audio kernels now rather than on the first WebSocket chunk
+    warmup_audio_kernels()
     logger.info("✅ All module handlers initialized (Upload, LiveSpeech, APIDocs)")
 except Exception as e:
     logger.error(f"❌ Failed to initialize module handlers: {e}")
@@ -218,26 +282,53 @@ app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
 # ==================== MAIN ROUTES ====================
 
 
-@app.route("/")
-def index():
-    """Enhanced Purple Gradient Interface - Original UI Preserved"""
-    status_text = "🟢 System Ready" if WHISPER_AVAILABLE else "🔴 Whisper Unavailable"
+MAIN_INTERFACE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+MAIN_INTERFACE_TEMPLATE = os.path.join(MAIN_INTERFACE_DIR, "main_interface.html")
+MAIN_INTERFACE_SCRIPT = os.path.join(MAIN_INTERFACE_DIR, "main_interface.js")
 
-    try:
-        # Get the directory of the current script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        template_path = os.path.join(script_dir, "templates", "main_interface.html")
 
-        with open(template_path, "r") as f:
-            template = f.read()
+def precompress(body):
+    """Pair a static body with its gzip copy and an ETag"""
+    return body, gzip.compress(body, compresslevel=9, mtime=0), hashlib.sha1(body).hexdigest()
 
-        # Replace status placeholder
-        template = template.replace("{{ status_text }}", status_text)
 
-        return template
+def render_main_interface(whisper_available, script_version):
+    """Render the main interface once - the page links its script by content hash"""
+    status_text = "🟢 System Ready" if whisper_available else "🔴 Whisper Unavailable"
+    with open(MAIN_INTERFACE_TEMPLATE, "r", encoding="utf-8") as f:
+        html = f.read().replace("{{ status_text }}", status_text).replace("{{ script_version }}", script_version)
+    return precompress(html.encode("utf-8"))
 
-    except Exception as e:
-        logger.error(f"Error loading main interface: {e}")
+
+def precompressed_response(asset, mimetype, max_age):
+    """Conditional response carrying the gzip copy of a precompressed asset when the client accepts it"""
+    body, body_gz, etag = asset
+    if request.accept_encodings["gzip"]:
+        response = Response(body_gz, mimetype=mimetype)
+        response.content_encoding = "gzip"
+        etag += "-gz"
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.vary.add("Accept-Encoding")
+    response.set_etag(etag)
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+try:
+    with open(MAIN_INTERFACE_SCRIPT, "rb") as f:
+        MAIN_INTERFACE_JS = precompress(f.read())
+    MAIN_INTERFACE = render_main_interface(WHISPER_AVAILABLE, MAIN_INTERFACE_JS[2][:12])
+except Exception as e:
+    logger.error(f"Error loading main interface: {e}")
+    MAIN_INTERFACE_JS = MAIN_INTERFACE = None
+
+
+@app.route("/")
+def index():
+    """Enhanced Purple Gradient Interface - Original UI Preserved"""
+    if MAIN_INTERFACE is None:
+        status_text = "🟢 System Ready" if WHISPER_AVAILABLE else "🔴 Whisper Unavailable"
         # Fallback simple interface
         return f"""
         <html><body style="font-family: Arial; text-align: center; padding: 50px;">
@@ -247,6 +338,19 @@ def index():
         </body></html>
         """
 
+    return precompressed_response(MAIN_INTERFACE, "text/html", 3600)
+
+
+@app.route("/static/main_interface.js")
+def main_interface_script():
+    """Main interface script - versioned by content hash in the page, so it is cached for a day"""
+    if MAIN_INTERFACE_JS is None:
+        return "Main interface script not available", 404
+
+    response = precompressed_response(MAIN_INTERFACE_JS, "application/javascript", 86400)
+    response.cache_control.public = True
+    return response
+
 
 # ==================== API ROUTES ====================
 
@@ -254,7 +358,7 @@ def index():
 @app.route("/health")
 def health():
     """Health check endpoint - Original functionality preserved"""
-    uptime = (datetime.now() - system_stats["uptime_start"]).total_seconds()
+    uptime = time.monotonic() - system_stats["uptime_start_monotonic"]
     model_status = model_manager.get_status()
     return jsonify(
         {
@@ -267,6 +371,7 @@ def health():
             "system_ready": system_ready,
             "timestamp": datetime.now().isoformat(),
             "model_status": model_status,
+            "transcription_cache": transcription_cache.get_stats(),
         }
     )
 
@@ -1548,7 +1653,7 @@ def transcribe_live():
 @app.route("/api/status")
 def api_status():
     """Detailed API status - Enhanced version"""
-    uptime = (datetime.now() - system_stats["uptime_start"]).total_seconds()
+    uptime = time.monotonic() - system_stats["uptime_start_monotonic"]
     return jsonify(
         {
             "service": "WhisperS2T Enhanced Appliance",
@@ -1618,6 +1723,12 @@ def handle_audio_chunk(data):
     return live_speech_handler.handle_audio_chunk(data)
 
 
+@socketio.on("audio_frames")
+def handle_audio_frames(data):
+    """Streamed PCM frames - collected until stop_recording"""
+    return live_speech_handler.handle_audio_frames(data)
+
+
 @socketio.on("start_recording")
 def handle_start_recording(data):
     """Start recording - NEW FEATURE"""
@@ -1763,7 +1874,13 @@ if __name__ == "__main__":
 
         # Run with SSL
         socketio.run(
-            app, host="0.0.0.0", port=5001, debug=False, allow_unsafe_werkzeug=True, ssl_context=(ssl_cert_path, ssl_key_path)
+            app,
+            host="0.0.0.0",
+            port=5001,
+            debug=False,
+            allow_unsafe_werkzeug=True,
+            ssl_context=(ssl_cert_path, ssl_key_path),
+            request_handler=NoDelayRequestHandler,
         )
     else:
         logger.warning("🔓 No SSL certificates found - Starting without HTTPS")
@@ -1775,7 +1892,9 @@ if __name__ == "__main__":
         logger.info("🏥 Health Check: http://0.0.0.0:5001/health")
 
         # Run without SSL
-        socketio.run(app, host="0.0.0.0", port=5001, debug=False, allow_unsafe_werkzeug=True)
+        socketio.run(
+            app, host="0.0.0.0", port=5001, debug=False, allow_unsafe_werkzeug=True, request_handler=NoDelayRequestHandler
+        )
 
     logger.info("✨ Features: Purple Gradient UI + REAL Live Speech + Upload + Full Navigation + HTTPS Support")
 
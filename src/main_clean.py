@@ -20,52 +20,45 @@ Main entry point with simplified architecture
 Version: 0.10.0
 """
 
+import functools
+import gzip
+import hashlib
+import json
 import logging
 import os
 import sys
-import tempfile
+import threading
+import time
 from datetime import datetime
+from pathlib import Path
 
 # CRITICAL: Add current directory to Python path for container compatibility
 current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+# SSL certificates live in <repo>/ssl - resolved once at import
+SSL_DIR = Path(__file__).resolve().parent.parent / "ssl"
+SSL_CERT_PATH = SSL_DIR / "whisper-appliance.crt"
+SSL_KEY_PATH = SSL_DIR / "whisper-appliance.key"
+
 # Flask and extensions
-from flask import Flask, jsonify, render_template, request, send_from_directory
+from flask import Flask, Response, jsonify, render_template, request
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 from flask_swagger_ui import get_swaggerui_blueprint
 from werkzeug.utils import secure_filename
 
-# Import our modular components with error handling
+# Import our modular components with error handling - the core components below are
+# built at startup; only the live speech handler and enterprise maintenance wait for first use
 try:
-    from modules import (
-        AdminPanel,
-        APIDocs,
-        ChatHistoryManager,
-        LiveSpeechHandler,
-        ModelManager,
-        UploadHandler,
-    )
+    import modules
 
     print("✅ Core modules imported successfully")
 except ImportError as e:
     print(f"❌ Core module import failed: {e}")
     raise
 
-# Import Maintenance System
-try:
-    from modules import EnterpriseMaintenanceManager, MaintenanceManager
-
-    MAINTENANCE_MANAGER_AVAILABLE = True
-    print("✅ Maintenance System imported successfully")
-except ImportError as e:
-    MaintenanceManager = None
-    EnterpriseMaintenanceManager = None
-    MAINTENANCE_MANAGER_AVAILABLE = False
-    print(f"⚠️ Maintenance System not available: {e}")
-
 # 🎯 SINGLE UPDATE SYSTEM: Enterprise Update System ONLY
 try:
     from modules.update.enterprise import integrate_with_flask_app
@@ -77,51 +70,50 @@ except ImportError as e:
     print(f"❌ CRITICAL: Enterprise Update System not available: {e}")
     print("🚨 UPDATE SYSTEM DISABLED - No update functionality available")
 
+    _DISABLED_TROUBLESHOOTING = [
+        "Check that modules.update.enterprise imports correctly",
+        "Verify container deployment completed successfully",
+        "Check application logs for import errors",
+    ]
+    _DISABLED_MESSAGE = "Update System Disabled - Enterprise Update System not available"
+
+    # (rule, endpoint, methods, extra payload) for each disabled update endpoint
+    DISABLED_UPDATE_ENDPOINTS = (
+        (
+            "/api/enterprise/deployment-info",
+            "api_deployment_info_disabled",
+            ["GET"],
+            {"deployment_type": "unknown", "update_system": "disabled"},
+        ),
+        (
+            "/api/enterprise/check-updates",
+            "api_check_updates_disabled",
+            ["GET"],
+            {"troubleshooting": _DISABLED_TROUBLESHOOTING},
+        ),
+        (
+            "/api/enterprise/start-update",
+            "api_start_update_disabled",
+            ["POST"],
+            {"troubleshooting": _DISABLED_TROUBLESHOOTING},
+        ),
+        ("/api/enterprise/update-status", "api_update_status_disabled", ["GET"], {"update_state": "disabled"}),
+    )
+
     def integrate_with_flask_app(app, logger=None):
         """Disabled update system - Enterprise Update System not available"""
         if logger:
             logger.error("🚨 UPDATE SYSTEM DISABLED: Enterprise Update System not available")
 
-        @app.route("/api/enterprise/deployment-info", methods=["GET"])
-        def api_deployment_info_disabled():
-            return {
-                "status": "error",
-                "message": "Update System Disabled - Enterprise Update System not available",
-                "deployment_type": "unknown",
-                "update_system": "disabled",
-            }, 503
-
-        @app.route("/api/enterprise/check-updates", methods=["GET"])
-        def api_check_updates_disabled():
-            return {
-                "status": "error",
-                "message": "Update System Disabled - Enterprise Update System not available",
-                "troubleshooting": [
-                    "Check that modules.update.enterprise imports correctly",
-                    "Verify container deployment completed successfully",
-                    "Check application logs for import errors",
-                ],
-            }, 503
-
-        @app.route("/api/enterprise/start-update", methods=["POST"])
-        def api_start_update_disabled():
-            return {
-                "status": "error",
-                "message": "Update System Disabled - Enterprise Update System not available",
-                "troubleshooting": [
-                    "Check that modules.update.enterprise imports correctly",
-                    "Verify container deployment completed successfully",
-                    "Check application logs for import errors",
-                ],
-            }, 503
-
-        @app.route("/api/enterprise/update-status", methods=["GET"])
-        def api_update_status_disabled():
-            return {
-                "status": "error",
-                "message": "Update System Disabled - Enterprise Update System not available",
-                "update_state": "disabled",
-            }, 503
+        for rule, endpoint, methods, extra in DISABLED_UPDATE_ENDPOINTS:
+            # Payload is serialized once - each view just returns the same bytes
+            body = json.dumps({"status": "error", "message": _DISABLED_MESSAGE, **extra}).encode("utf-8")
+            app.add_url_rule(
+                rule,
+                endpoint,
+                lambda body=body: Response(body, status=503, mimetype="application/json"),
+                methods=methods,
+            )
 
 
 # Initialize Flask app
@@ -135,32 +127,51 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+# The format above never uses thread/process fields - skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
 # System statistics and state
-system_stats = {"uptime_start": datetime.now(), "total_transcriptions": 0, "active_connections": 0}
+system_stats = modules.SystemStats(
+    uptime_start=datetime.now(), uptime_start_monotonic=time.monotonic(), total_transcriptions=0, active_connections=0
+)
 connected_clients = []
 system_ready = True
 
-# Initialize Enterprise Maintenance System
-enterprise_maintenance = None
-if MAINTENANCE_MANAGER_AVAILABLE and EnterpriseMaintenanceManager is not None:
+
+@functools.lru_cache(maxsize=None)
+def get_enterprise_maintenance():
+    """Initialize the Enterprise Maintenance System on first use"""
+    EnterpriseMaintenanceManager = getattr(modules, "EnterpriseMaintenanceManager", None)
+    if EnterpriseMaintenanceManager is None:
+        logger.info("ℹ️ Enterprise Maintenance System not available")
+        return None
+
     try:
-        enterprise_maintenance = EnterpriseMaintenanceManager()
+        maintenance = EnterpriseMaintenanceManager()
         logger.info("✅ Enterprise Maintenance System initialized")
+        return maintenance
     except Exception as e:
-        logger.warning(f"⚠️ Enterprise Maintenance System initialization failed: {e}")
-        enterprise_maintenance = None
-else:
-    logger.info("ℹ️ Enterprise Maintenance System not available")
+        logger.warning("⚠️ Enterprise Maintenance System initialization failed: %s", e)
+        return None
+
 
 # Initialize Model Manager and Chat History
 try:
-    model_manager = ModelManager()
-    chat_history = ChatHistoryManager()
+    # Persistent model cache (a volume in containers) so restarts skip the download
+    # WHISPER_TORCH_COMPILE=1 trades a slower first load for faster encoder passes
+    model_manager = modules.ModelManager(
+        cache_dir=os.environ.get("WHISPER_CACHE_DIR"),
+        torch_compile=os.environ.get("WHISPER_TORCH_COMPILE", "0") == "1",
+        # WHISPER_QUANT=int8 opts into faster-whisper (CTranslate2) when it is installed
+        quantization=os.environ.get("WHISPER_QUANT") or None,
+    )
+    chat_history = modules.ChatHistoryManager()
     logger.info("✅ Model Manager and Chat History initialized")
 except Exception as e:
-    logger.error(f"❌ Failed to initialize core components: {e}")
+    logger.error("❌ Failed to initialize core components: %s", e)
     # Use minimal fallback components
     model_manager = None
     chat_history = None
@@ -170,36 +181,80 @@ WHISPER_AVAILABLE = False
 if model_manager:
     try:
         logger.info("Loading default Whisper model...")
-        if model_manager.load_model("base"):
+        if model_manager.load_model(os.environ.get("WHISPER_MODEL", "base")):
             WHISPER_AVAILABLE = True
             logger.info("✅ Whisper model loaded successfully")
         else:
             WHISPER_AVAILABLE = False
             logger.warning("⚠️ Failed to load default model, will try on-demand")
     except Exception as e:
-        logger.error(f"❌ Failed to load Whisper model: {e}")
+        logger.error("❌ Failed to load Whisper model: %s", e)
         WHISPER_AVAILABLE = False
 else:
     logger.warning("⚠️ Model Manager not available")
 
+# Cache transcription results by audio content so repeated clips skip inference
+transcription_cache = modules.TranscriptionCache(max_entries=256)
+
+# Coalesce concurrent short live speech chunks into batched Whisper decodes
+transcription_batcher = modules.TranscriptionBatcher(model_manager, max_batch=8, max_wait_ms=10) if model_manager else None
+
 # Initialize module handlers with proper fallback handling
 try:
-    upload_handler = UploadHandler(model_manager, WHISPER_AVAILABLE, system_stats, chat_history)
-    live_speech_handler = LiveSpeechHandler(model_manager, WHISPER_AVAILABLE, system_stats, connected_clients, chat_history)
+    upload_handler = modules.UploadHandler(
+        model_manager,
+        WHISPER_AVAILABLE,
+        system_stats,
+        chat_history,
+        transcription_cache=transcription_cache,
+    )
 
     # AdminPanel initialization without UpdateManager dependency
-    admin_panel = AdminPanel(WHISPER_AVAILABLE, system_stats, connected_clients, model_manager, chat_history)
+    admin_panel = modules.AdminPanel(WHISPER_AVAILABLE, system_stats, connected_clients, model_manager, chat_history)
 
-    api_docs = APIDocs(version="0.10.0")
+    api_docs = modules.APIDocs(version="0.10.0")
+
+    # Compile the live audio kernels now rather than on the first WebSocket chunk
+    modules.warmup_audio_kernels()
     logger.info("✅ All module handlers initialized")
 except Exception as e:
-    logger.error(f"❌ Failed to initialize module handlers: {e}")
+    logger.error("❌ Failed to initialize module handlers: %s", e)
     # Create minimal fallback handlers
     upload_handler = None
-    live_speech_handler = None
     admin_panel = None
     api_docs = None
 
+# Live speech is only needed once a WebSocket client shows up
+live_speech_handler = None
+_live_speech_lock = threading.Lock()
+
+
+def get_live_speech_handler():
+    """Create the live speech handler on first use - its events are registered below"""
+    global live_speech_handler
+
+    if live_speech_handler is None:
+        with _live_speech_lock:
+            if live_speech_handler is None:
+                try:
+                    handler = modules.LiveSpeechHandler(
+                        model_manager,
+                        WHISPER_AVAILABLE,
+                        system_stats,
+                        connected_clients,
+                        chat_history,
+                        transcription_cache=transcription_cache,
+                        batcher=transcription_batcher,
+                        # WHISPER_SILENCE_RMS (e.g. 0.005) skips near-silent chunks; unset keeps every chunk
+                        silence_rms_threshold=float(os.environ.get("WHISPER_SILENCE_RMS", 0)) or None,
+                    )
+                    live_speech_handler = handler
+                    logger.info("✅ Live speech handler initialized")
+                except Exception as e:
+                    logger.error("❌ Failed to initialize live speech handler: %s", e)
+    return live_speech_handler
+
+
 # Configure SwaggerUI
 SWAGGER_URL = "/docs"
 API_URL = "/api/openapi.json"
@@ -212,35 +267,88 @@ app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
 # ==================== MAIN ROUTES ====================
 
 
-@app.route("/")
-def index():
-    """Enhanced Purple Gradient Interface - Original UI Preserved"""
-    status_text = "🟢 System Ready" if WHISPER_AVAILABLE else "🔴 Whisper Unavailable"
+# Landing page variants are rendered once and served from memory
+MAIN_INTERFACE_TEMPLATE = os.path.join(current_dir, "templates", "main_interface.html")
+MAIN_INTERFACE_SCRIPT = os.path.join(current_dir, "templates", "main_interface.js")
 
-    try:
-        # Get the directory of the current script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        template_path = os.path.join(script_dir, "templates", "main_interface.html")
 
-        with open(template_path, "r") as f:
-            template = f.read()
+def _get_status_text(whisper_available):
+    """Status line shown on the main interface"""
+    return "🟢 System Ready" if whisper_available else "🔴 Whisper Unavailable"
 
-        # Replace status placeholder
-        template = template.replace("{{ status_text }}", status_text)
 
-        return template
+def _precompress(body):
+    """Pair a static body with its gzip copy and an ETag so gzip never runs per request"""
+    return body, gzip.compress(body, compresslevel=9, mtime=0), hashlib.sha1(body).hexdigest()
 
-    except Exception as e:
-        logger.error(f"Error loading main interface: {e}")
+
+def prerender_main_interface():
+    """Render both status variants of the main interface and its script"""
+    with open(MAIN_INTERFACE_TEMPLATE, "r", encoding="utf-8") as f:
+        template = f.read()
+    with open(MAIN_INTERFACE_SCRIPT, "rb") as f:
+        script = _precompress(f.read())
+
+    # The page links the script by content hash, so the script can be cached long-term
+    template = template.replace("{{ script_version }}", script[2][:12])
+    variants = {
+        whisper_available: _precompress(
+            template.replace("{{ status_text }}", _get_status_text(whisper_available)).encode("utf-8")
+        )
+        for whisper_available in (True, False)
+    }
+    return variants, script
+
+
+try:
+    MAIN_INTERFACE_VARIANTS, MAIN_INTERFACE_JS = prerender_main_interface()
+except Exception as e:
+    logger.error("Error pre-rendering main interface: %s", e)
+    MAIN_INTERFACE_VARIANTS, MAIN_INTERFACE_JS = {}, None
+
+
+def _send_precompressed(asset, mimetype, max_age):
+    """Conditional response carrying the gzip copy of a pre-rendered asset when the client accepts it"""
+    body, body_gz, etag = asset
+    if request.accept_encodings["gzip"]:
+        response = Response(body_gz, mimetype=mimetype)
+        response.content_encoding = "gzip"
+        etag += "-gz"
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.vary.add("Accept-Encoding")
+    response.set_etag(etag)
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+@app.route("/")
+def index():
+    """Enhanced Purple Gradient Interface - Original UI Preserved"""
+    page = MAIN_INTERFACE_VARIANTS.get(WHISPER_AVAILABLE)
+    if page is None:
         # Fallback simple interface
         return f"""
         <html><body style="font-family: Arial; text-align: center; padding: 50px;">
         <h1>🎤 WhisperS2T Appliance</h1>
-        <p>Status: {status_text}</p>
+        <p>Status: {_get_status_text(WHISPER_AVAILABLE)}</p>
         <p><a href="/admin">Admin Panel</a> | <a href="/docs">API Docs</a></p>
         </body></html>
         """
 
+    return _send_precompressed(page, "text/html", 3600)
+
+
+@app.route("/static/main_interface.js")
+def main_interface_script():
+    """Main interface script - versioned by content hash in the page, so it is cached for a day"""
+    if MAIN_INTERFACE_JS is None:
+        return "Main interface script not available", 404
+
+    response = _send_precompressed(MAIN_INTERFACE_JS, "application/javascript", 86400)
+    response.cache_control.public = True
+    return response
+
 
 # ==================== API ROUTES ====================
 
@@ -248,7 +356,7 @@ def index():
 @app.route("/health")
 def health():
     """Health check endpoint - Original functionality preserved"""
-    uptime = (datetime.now() - system_stats["uptime_start"]).total_seconds()
+    uptime = time.monotonic() - system_stats["uptime_start_monotonic"]
     model_status = model_manager.get_status() if model_manager else {"status": "unavailable"}
     return jsonify(
         {
@@ -261,6 +369,7 @@ def health():
             "system_ready": system_ready,
             "timestamp": datetime.now().isoformat(),
             "model_status": model_status,
+            "transcription_cache": transcription_cache.get_stats(),
             "update_system": "enterprise" if ENTERPRISE_UPDATE_AVAILABLE else "disabled",
         }
     )
@@ -268,15 +377,6 @@ def health():
 
 # ==================== MODULE ROUTES ====================
 
-# Register upload handler routes
-if upload_handler:
-    upload_handler.register_routes(app)
-
-# Register live speech handler routes and websocket events
-if live_speech_handler:
-    live_speech_handler.register_routes(app)
-    live_speech_handler.register_websocket_events(socketio)
-
 # Register admin panel routes
 if admin_panel:
     admin_panel.register_routes(app)
@@ -286,6 +386,22 @@ if api_docs:
     api_docs.register_routes(app)
 
 
+@app.route("/transcribe", methods=["POST"])
+def transcribe():
+    """Upload transcription - Delegated to UploadHandler"""
+    if not upload_handler:
+        return jsonify({"error": "Upload handler not available"}), 503
+    return upload_handler.transcribe_upload()
+
+
+@app.route("/api/transcribe-live", methods=["POST"])
+def transcribe_live():
+    """Live transcription API - Delegated to UploadHandler"""
+    if not upload_handler:
+        return jsonify({"error": "Upload handler not available"}), 503
+    return upload_handler.transcribe_live_api()
+
+
 # ==================== MODEL MANAGEMENT ROUTES ====================
 
 
@@ -318,14 +434,12 @@ def switch_model(model_name):
         return jsonify({"error": f"Invalid model: {model_name}", "status": "error"}), 400
 
     # Load model in background to avoid blocking
-    import threading
-
     def load_model():
         success = model_manager.load_model(model_name)
         if success:
-            logger.info(f"Model switched to: {model_name}")
+            logger.info("Model switched to: %s", model_name)
         else:
-            logger.error(f"Failed to switch to model: {model_name}")
+            logger.error("Failed to switch to model: %s", model_name)
 
     thread = threading.Thread(target=load_model, daemon=True)
     thread.start()
@@ -345,12 +459,7 @@ def get_chat_history():
     limit = request.args.get("limit", 50, type=int)
     source_type = request.args.get("source", None)
 
-    if source_type:
-        transcriptions = chat_history.get_transcriptions_by_source(source_type, limit)
-    else:
-        transcriptions = chat_history.get_recent_transcriptions(limit)
-
-    return jsonify({"transcriptions": transcriptions, "count": len(transcriptions), "status": "success"})
+    return Response(chat_history.get_recent_transcriptions_json(limit, source_type), mimetype="application/json")
 
 
 # Add more chat history routes here if needed...
@@ -361,22 +470,87 @@ def get_chat_history():
 
 @socketio.on("connect")
 def handle_connect():
-    """Handle client connection"""
+    """Handle client connection - Delegated to LiveSpeechHandler when available"""
+    handler = get_live_speech_handler()
+    if handler:
+        return handler.handle_connect()
     client_id = request.sid
     connected_clients.append(client_id)
     system_stats["active_connections"] = len(connected_clients)
-    logger.info(f"Client connected: {client_id}")
+    logger.info("Client connected: %s", client_id)
     emit("connection_response", {"status": "connected", "client_id": client_id})
 
 
 @socketio.on("disconnect")
 def handle_disconnect():
-    """Handle client disconnection"""
+    """Handle client disconnection - Delegated to LiveSpeechHandler when available"""
+    handler = get_live_speech_handler()
+    if handler:
+        return handler.handle_disconnect()
     client_id = request.sid
     if client_id in connected_clients:
         connected_clients.remove(client_id)
     system_stats["active_connections"] = len(connected_clients)
-    logger.info(f"Client disconnected: {client_id}")
+    logger.info("Client disconnected: %s", client_id)
+
+
+def _live_speech_unavailable():
+    """Tell the client live transcription cannot run"""
+    emit("transcription_error", {"error": "Live speech handler not available"})
+
+
+@socketio.on("audio_chunk")
+def handle_audio_chunk(data):
+    """Audio chunk processing - Delegated to LiveSpeechHandler"""
+    handler = get_live_speech_handler()
+    if not handler:
+        return _live_speech_unavailable()
+    return handler.handle_audio_chunk(data)
+
+
+@socketio.on("audio_frames")
+def handle_audio_frames(data):
+    """Streamed PCM frames - Delegated to LiveSpeechHandler"""
+    handler = get_live_speech_handler()
+    if not handler:
+        return _live_speech_unavailable()
+    return handler.handle_audio_frames(data)
+
+
+@socketio.on("start_recording")
+def handle_start_recording(data):
+    """Start recording - Delegated to LiveSpeechHandler"""
+    handler = get_live_speech_handler()
+    if not handler:
+        return _live_speech_unavailable()
+    return handler.handle_start_recording(data)
+
+
+@socketio.on("stop_recording")
+def handle_stop_recording(data):
+    """Stop recording - Delegated to LiveSpeechHandler"""
+    handler = get_live_speech_handler()
+    if not handler:
+        return _live_speech_unavailable()
+    return handler.handle_stop_recording(data)
+
+
+@socketio.on("transcription_result")
+def handle_transcription_result(data):
+    """Transcription result - Delegated to LiveSpeechHandler"""
+    handler = get_live_speech_handler()
+    if not handler:
+        return _live_speech_unavailable()
+    return handler.handle_transcription_result(data)
+
+
+@socketio.on("transcription_error")
+def handle_transcription_error(data):
+    """Transcription error - Delegated to LiveSpeechHandler"""
+    handler = get_live_speech_handler()
+    if not handler:
+        return None
+    return handler.handle_transcription_error(data)
 
 
 # ==================== STARTUP LOGIC ====================
@@ -403,18 +577,18 @@ if __name__ == "__main__":
 
     # Auto-detect SSL certificates
     ssl_context = None
-    ssl_cert_path = os.path.join(current_dir, "..", "ssl", "whisper-appliance.crt")
-    ssl_key_path = os.path.join(current_dir, "..", "ssl", "whisper-appliance.key")
-
-    if os.path.exists(ssl_cert_path) and os.path.exists(ssl_key_path):
-        ssl_context = (ssl_cert_path, ssl_key_path)
+    if SSL_CERT_PATH.is_file() and SSL_KEY_PATH.is_file():
+        ssl_context = (str(SSL_CERT_PATH), str(SSL_KEY_PATH))
         logger.info("🔐 SSL certificates found - HTTPS enabled")
     else:
         logger.info("🔓 No SSL certificates found - HTTP mode")
 
+    # The live speech module is first needed by a WebSocket client - import it while the server starts
+    modules.warm_modules_in_background()
+
     # Start the application
     try:
         socketio.run(app, host="0.0.0.0", port=5001, debug=False, ssl_context=ssl_context, allow_unsafe_werkzeug=True)
     except Exception as e:
-        logger.error(f"❌ Failed to start application: {e}")
+        logger.error("❌ Failed to start application: %s", e)
         sys.exit(1)
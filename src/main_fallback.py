@@ -4,13 +4,15 @@ WhisperS2T Fallback Application
 Quick fix when Whisper is not available
 """
 
+import gzip
 import logging
-import os
 import tempfile
+import textwrap
 import threading
 from datetime import datetime
+from pathlib import Path
 
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 
 app = Flask(__name__)
@@ -21,6 +23,11 @@ CORS(app)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SSL certificates live in <repo>/ssl - resolved once at import
+SSL_DIR = Path(__file__).resolve().parent.parent / "ssl"
+SSL_CERT_PATH = SSL_DIR / "whisper-appliance.crt"
+SSL_KEY_PATH = SSL_DIR / "whisper-appliance.key"
+
 
 # Mock Whisper class
 class MockWhisper:
@@ -140,10 +147,86 @@ UPLOAD_TEMPLATE = """
 </html>
 """
 
+# Stylesheet shared by the admin and docs pages
+PAGE_STYLE = """<style>body{font-family:Arial;margin:40px;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;}
+    .container{max-width:800px;margin:0 auto;background:rgba(255,255,255,0.1);padding:30px;border-radius:15px;}
+    .nav a{color:rgba(255,255,255,0.8);text-decoration:none;margin:0 15px;}</style>"""
+
+ADMIN_TEMPLATE = (
+    """
+    <html>
+    <head><title>Admin Panel</title>
+    """
+    + PAGE_STYLE
+    + """
+    </head>
+    <body>
+    <div class="container">
+        <h1>⚙️ Admin Panel</h1>
+        <div class="nav">
+            <a href="/">🏠 Home</a> | <a href="/health">🏥 Health</a> | <a href="/docs">📚 API Docs</a>
+        </div>
+        <p>Status: Quick Start Mode - Install OpenAI Whisper for full functionality</p>
+        <p>Service: Running (Fallback)</p>
+        <p>To enable full AI transcription: <code>pip3 install --user openai-whisper</code></p>
+    </div>
+    </body>
+    </html>
+    """
+)
+
+DOCS_TEMPLATE = (
+    """
+    <html>
+    <head><title>API Documentation</title>
+    """
+    + PAGE_STYLE
+    + """
+    </head>
+    <body>
+    <div class="container">
+        <h1>📚 API Documentation</h1>
+        <div class="nav">
+            <a href="/">🏠 Home</a> | <a href="/admin">⚙️ Admin</a> | <a href="/health">🏥 Health</a>
+        </div>
+        <h3>Available Endpoints:</h3>
+        <ul>
+            <li><strong>GET /</strong> - Main interface</li>
+            <li><strong>POST /transcribe</strong> - Upload audio for transcription</li>
+            <li><strong>GET /health</strong> - Health check</li>
+            <li><strong>GET /admin</strong> - Admin panel</li>
+        </ul>
+        <p><strong>Note:</strong> This is a minimal version. Install openai-whisper for full API functionality.</p>
+    </div>
+    </body>
+    </html>
+    """
+)
+
+# The pages have no template variables - dedented and encoded once at import and served as-is
+UPLOAD_PAGE = textwrap.dedent(UPLOAD_TEMPLATE).strip().encode("utf-8")
+ADMIN_PAGE = textwrap.dedent(ADMIN_TEMPLATE).strip().encode("utf-8")
+DOCS_PAGE = textwrap.dedent(DOCS_TEMPLATE).strip().encode("utf-8")
+# Compressed once as well, so gzip never runs per request
+UPLOAD_PAGE_GZ = gzip.compress(UPLOAD_PAGE, compresslevel=9, mtime=0)
+ADMIN_PAGE_GZ = gzip.compress(ADMIN_PAGE, compresslevel=9, mtime=0)
+DOCS_PAGE_GZ = gzip.compress(DOCS_PAGE, compresslevel=9, mtime=0)
+
+
+def page_response(page, page_gz):
+    """HTML response carrying the precompressed page when the client accepts gzip"""
+    if request.accept_encodings["gzip"]:
+        response = Response(page_gz, mimetype="text/html")
+        response.content_encoding = "gzip"
+    else:
+        response = Response(page, mimetype="text/html")
+    response.vary.add("Accept-Encoding")
+    return response
+
 
 @app.route("/")
 def index():
-    return render_template_string(UPLOAD_TEMPLATE)
+    return page_response(UPLOAD_PAGE, UPLOAD_PAGE_GZ)
 
 
 @app.route("/transcribe", methods=["POST"])
@@ -190,59 +273,12 @@ def health():
 
 @app.route("/admin")
 def admin():
-    return render_template_string(
-        """
-    <html>
-    <head><title>Admin Panel</title>
-    <style>body{font-family:Arial;margin:40px;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;}
-    .container{max-width:800px;margin:0 auto;background:rgba(255,255,255,0.1);padding:30px;border-radius:15px;}
-    .nav a{color:rgba(255,255,255,0.8);text-decoration:none;margin:0 15px;}</style>
-    </head>
-    <body>
-    <div class="container">
-        <h1>⚙️ Admin Panel</h1>
-        <div class="nav">
-            <a href="/">🏠 Home</a> | <a href="/health">🏥 Health</a> | <a href="/docs">📚 API Docs</a>
-        </div>
-        <p>Status: Quick Start Mode - Install OpenAI Whisper for full functionality</p>
-        <p>Service: Running (Fallback)</p>
-        <p>To enable full AI transcription: <code>pip3 install --user openai-whisper</code></p>
-    </div>
-    </body>
-    </html>
-    """
-    )
+    return page_response(ADMIN_PAGE, ADMIN_PAGE_GZ)
 
 
 @app.route("/docs")
 def docs():
-    return render_template_string(
-        """
-    <html>
-    <head><title>API Documentation</title>
-    <style>body{font-family:Arial;margin:40px;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);color:white;}
-    .container{max-width:800px;margin:0 auto;background:rgba(255,255,255,0.1);padding:30px;border-radius:15px;}
-    .nav a{color:rgba(255,255,255,0.8);text-decoration:none;margin:0 15px;}</style>
-    </head>
-    <body>
-    <div class="container">
-        <h1>📚 API Documentation</h1>
-        <div class="nav">
-            <a href="/">🏠 Home</a> | <a href="/admin">⚙️ Admin</a> | <a href="/health">🏥 Health</a>
-        </div>
-        <h3>Available Endpoints:</h3>
-        <ul>
-            <li><strong>GET /</strong> - Main interface</li>
-            <li><strong>POST /transcribe</strong> - Upload audio for transcription</li>
-            <li><strong>GET /health</strong> - Health check</li>
-            <li><strong>GET /admin</strong> - Admin panel</li>
-        </ul>
-        <p><strong>Note:</strong> This is a minimal version. Install openai-whisper for full API functionality.</p>
-    </div>
-    </body>
-    </html>
-    """
-    )
+    return page_response(DOCS_PAGE, DOCS_PAGE_GZ)
 
 
 if __name__ == "__main__":
@@ -251,18 +287,9 @@ if __name__ == "__main__":
     logger.info("🌐 Starting server on https://0.0.0.0:5001")
 
     # Check for SSL certificates
-    ssl_cert_path = None
-    ssl_key_path = None
-
-    # Try local development path
-    local_ssl_cert = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ssl", "whisper-appliance.crt")
-    local_ssl_key = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ssl", "whisper-appliance.key")
-
-    if os.path.exists(local_ssl_cert) and os.path.exists(local_ssl_key):
-        ssl_cert_path = local_ssl_cert
-        ssl_key_path = local_ssl_key
+    if SSL_CERT_PATH.is_file() and SSL_KEY_PATH.is_file():
         logger.info("🔒 SSL certificates found - Starting with HTTPS")
-        app.run(host="0.0.0.0", port=5001, debug=False, ssl_context=(ssl_cert_path, ssl_key_path))
+        app.run(host="0.0.0.0", port=5001, debug=False, ssl_context=(str(SSL_CERT_PATH), str(SSL_KEY_PATH)))
     else:
         logger.warning("🔓 No SSL certificates found - Starting HTTP only")
         logger.info("💡 Run ./create-ssl-cert.sh to enable HTTPS")
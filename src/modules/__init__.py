@@ -8,53 +8,158 @@ Enhanced modular architecture preserving all original features
 - Maintenance system: Enterprise maintenance management
 - Clean separation of concerns with backward compatibility
 
+Classes are loaded on first access - `from modules import *` imports every exported
+submodule, so prefer explicit imports: `from modules import UploadHandler`
+
 Version: 0.10.0
 """
 
+import importlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Final, Tuple
+
+if TYPE_CHECKING:
+    # Static analysers see the real symbols; at runtime they resolve through __getattr__
+    from .admin_panel import AdminPanel  # noqa: F401
+    from .api_docs import APIDocs  # noqa: F401
+    from .audio_kernels import warmup_audio_kernels  # noqa: F401
+    from .chat_history import ChatHistoryManager  # noqa: F401
+    from .live_speech import LiveSpeechHandler  # noqa: F401
+    from .maintenance import EnterpriseMaintenanceManager, MaintenanceManager  # noqa: F401
+    from .maintenance_mode import MaintenanceModeManager, MaintenanceModeMiddleware  # noqa: F401
+    from .model_manager import ModelManager  # noqa: F401
+    from .system_stats import SystemStats  # noqa: F401
+    from .transcription_batcher import TranscriptionBatcher  # noqa: F401
+    from .transcription_cache import TranscriptionCache  # noqa: F401
+    from .update.api import create_update_endpoints  # noqa: F401
+    from .update.manager import UpdateManager  # noqa: F401
+    from .upload_handler import UploadHandler  # noqa: F401
+
+    UPDATE_MANAGER_AVAILABLE: bool
+    MAINTENANCE_MANAGER_AVAILABLE: bool
+    MAINTENANCE_MODE_AVAILABLE: bool
+    LEGACY_UPDATE_CONFIG_AVAILABLE: bool
+    ENTERPRISE_MAINTENANCE_AVAILABLE: bool
+
 __version__ = "0.10.0"
 __author__ = "WhisperS2T Team"
 
-# Core module imports
-from .admin_panel import AdminPanel
-from .api_docs import APIDocs
-from .chat_history import ChatHistoryManager
-from .live_speech import LiveSpeechHandler
-from .model_manager import ModelManager
-from .upload_handler import UploadHandler
-
-# Update System
-try:
-    from .update import UpdateManager, create_update_endpoints
-
-    UPDATE_MANAGER_AVAILABLE = True
-except ImportError:
-    UpdateManager = None
-    create_update_endpoints = None
-    UPDATE_MANAGER_AVAILABLE = False
-
-# Maintenance System
-try:
-    from .maintenance import EnterpriseMaintenanceManager, MaintenanceManager
-
-    MAINTENANCE_MANAGER_AVAILABLE = True
-except ImportError:
-    MaintenanceManager = None
-    EnterpriseMaintenanceManager = None
-    MAINTENANCE_MANAGER_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
-# Enterprise Update System Integration (REMOVED - now using single update system)
+# Exported names map to (submodule, attribute) and are imported on first access
+# (PEP 562) so `import modules` stays cheap and callers only pay for what they use.
+_LAZY: Final[Dict[str, Tuple[str, str]]] = {
+    # Core modules
+    "AdminPanel": (".admin_panel", "AdminPanel"),
+    "APIDocs": (".api_docs", "APIDocs"),
+    "warmup_audio_kernels": (".audio_kernels", "warmup_audio_kernels"),
+    "ChatHistoryManager": (".chat_history", "ChatHistoryManager"),
+    "LiveSpeechHandler": (".live_speech", "LiveSpeechHandler"),
+    "ModelManager": (".model_manager", "ModelManager"),
+    "SystemStats": (".system_stats", "SystemStats"),
+    "TranscriptionBatcher": (".transcription_batcher", "TranscriptionBatcher"),
+    "TranscriptionCache": (".transcription_cache", "TranscriptionCache"),
+    "UploadHandler": (".upload_handler", "UploadHandler"),
+    # Update System
+    "UpdateManager": (".update.manager", "UpdateManager"),
+    "create_update_endpoints": (".update.api", "create_update_endpoints"),
+    # Maintenance System
+    "MaintenanceManager": (".maintenance", "MaintenanceManager"),
+    "EnterpriseMaintenanceManager": (".maintenance", "EnterpriseMaintenanceManager"),
+    "MaintenanceModeManager": (".maintenance_mode", "MaintenanceModeManager"),
+    "MaintenanceModeMiddleware": (".maintenance_mode", "MaintenanceModeMiddleware"),
+    # Legacy compatibility (DEPRECATED)
+    "UpdateConfig": (".update_config", "UpdateConfig"),
+}
+
+# Optional subsystems resolve to None when they cannot be imported
+_OPTIONAL: Final = frozenset({".update.manager", ".update.api", ".maintenance", ".maintenance_mode", ".update_config"})
+
+
+# Availability flags map to the optional subpackage they probe; each resolves to a bool on first access
+_FLAGS: Final[Dict[str, str]] = {
+    # Update System
+    "UPDATE_MANAGER_AVAILABLE": ".update",
+    # Maintenance System
+    "MAINTENANCE_MANAGER_AVAILABLE": ".maintenance",
+    "MAINTENANCE_MODE_AVAILABLE": ".maintenance_mode",
+    # Legacy compatibility imports (DEPRECATED - use new modular imports)
+    "LEGACY_UPDATE_CONFIG_AVAILABLE": ".update_config",
+}
+
+# Backward compatibility aliases, resolved to the current object on first access
+_ALIASES: Final[Dict[str, str]] = {
+    "ENTERPRISE_MAINTENANCE_AVAILABLE": "MAINTENANCE_MANAGER_AVAILABLE",
+}
+
+
+def _probe(module_name):
+    """Whether an optional subpackage imports cleanly"""
+    # find_spec only proves the package exists - importing proves it works
+    try:
+        importlib.import_module(module_name, __name__)
+    except Exception as e:
+        logger.debug("Optional module %s not available: %s", module_name, e)
+        return False
+    return True
 
-# Legacy compatibility imports (DEPRECATED - use new modular imports)
-try:
-    # Legacy UpdateConfig/UpdateManager (if still exists)
-    from .update_config import UpdateConfig
 
-    LEGACY_UPDATE_CONFIG_AVAILABLE = True
-except ImportError:
-    UpdateConfig = None
-    LEGACY_UPDATE_CONFIG_AVAILABLE = False
+def __getattr__(name):
+    """Import lazily exported names on first access and cache them in the module"""
+    if name in _ALIASES:
+        target = _ALIASES[name]
+        value = globals()[name] = globals()[target] if target in globals() else __getattr__(target)
+        return value
 
-__all__ = [
+    if name in _FLAGS:
+        value = globals()[name] = _probe(_FLAGS[name])
+        return value
+
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = _LAZY[name]
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    except ImportError as e:
+        if module_name not in _OPTIONAL:
+            raise
+        logger.debug("Optional module %s not available: %s", module_name, e)
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List only names that are already loaded, so introspection never triggers imports"""
+    return sorted(globals())
+
+
+# Submodules whose import cost dominates the first request
+_WARM_MODULES: Final = (".live_speech", ".model_manager", ".upload_handler")
+
+
+def _warm_modules():
+    """Import the heavy submodules so the cost overlaps with server startup"""
+    for module_name in _WARM_MODULES:
+        try:
+            importlib.import_module(module_name, __name__)
+        except Exception as e:
+            logger.debug("Background import of %s failed: %s", module_name, e)
+
+
+def warm_modules_in_background():
+    """Start importing the heavy submodules on a daemon thread - for server entry points only"""
+    thread = threading.Thread(target=_warm_modules, name="modules-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+# Enterprise Update System Integration (REMOVED - now using single update system)
+
+__all__ = (
     # Core modules
     "LiveSpeechHandler",
     "UploadHandler",
@@ -62,6 +167,10 @@ __all__ = [
     "APIDocs",
     "ModelManager",
     "ChatHistoryManager",
+    "SystemStats",
+    "TranscriptionBatcher",
+    "TranscriptionCache",
+    "warmup_audio_kernels",
     # Update System
     "UpdateManager",
     "create_update_endpoints",
@@ -70,12 +179,12 @@ __all__ = [
     "MaintenanceManager",
     "EnterpriseMaintenanceManager",  # Backward compatibility alias
     "MAINTENANCE_MANAGER_AVAILABLE",
+    "MaintenanceModeManager",
+    "MaintenanceModeMiddleware",
+    "MAINTENANCE_MODE_AVAILABLE",
     # Legacy compatibility (DEPRECATED)
     "UpdateConfig",
     "LEGACY_UPDATE_CONFIG_AVAILABLE",
     # Legacy aliases for backward compatibility
     "ENTERPRISE_MAINTENANCE_AVAILABLE",  # Maps to MAINTENANCE_MANAGER_AVAILABLE
-]
-
-# Backward compatibility aliases
-ENTERPRISE_MAINTENANCE_AVAILABLE = MAINTENANCE_MANAGER_AVAILABLE
+)
@@ -2,10 +2,15 @@
 Admin Panel Module - Fixed Version
 """
 
+import functools
+import gzip
+import hashlib
 import logging
-from datetime import datetime
+import re
+import time
+from html import escape
 
-from flask import render_template_string
+from flask import Response, jsonify, request
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +101,12 @@ ADMIN_CSS = """
         text-align: left;
         border-bottom: 1px solid #ddd;
     }
+    .model-table th,
+    .model-table td {
+        padding: 8px;
+        border: 1px solid #ddd;
+    }
+    .model-table .table-head { background: #f8f9fa; }
     
     /* Quick Actions */
     .actions-section {
@@ -152,368 +163,29 @@ ADMIN_CSS = """
 """
 
 
-class AdminPanel:
-    """Fixed Admin Panel"""
-    
-    def __init__(self, whisper_available, system_stats, connected_clients, model_manager, chat_history, update_manager=None):
-        self.whisper_available = whisper_available
-        self.system_stats = system_stats
-        self.connected_clients = connected_clients
-        self.model_manager = model_manager
-        self.chat_history = chat_history
-        self.update_manager = update_manager
-        self.update_available = update_manager is not None
 
-    def _safe_get_current_model(self):
-        """Safely get current model name with fallback"""
-        if self.model_manager:
-            try:
-                return self.model_manager.get_current_model_name()
-            except Exception:
-                return "Error loading model"
-        return "Model Manager unavailable"
+def minify_css(css: str) -> str:
+    """Drop comments and collapse whitespace runs in a stylesheet"""
+    return re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", css, flags=re.S)).strip()
 
-    def _safe_get_available_models(self):
-        """Safely get available models with fallback"""
-        if self.model_manager:
-            try:
-                return self.model_manager.get_available_models()
-            except Exception:
-                return {}
-        return {}
 
-    def _safe_is_loading(self):
-        """Safely check if model is loading"""
-        if self.model_manager:
-            try:
-                return self.model_manager.is_model_loading()
-            except Exception:
-                return False
-        return False
+def minify_html(html: str) -> str:
+    """Drop HTML comments and line indentation - newlines are kept so inline JS stays valid"""
+    return re.sub(r"\n\s+", "\n", re.sub(r"<!--.*?-->", "", html, flags=re.S))
 
-    def get_admin_interface(self):
-        """Generate admin interface without f-string CSS issues"""
-        uptime = (datetime.now() - self.system_stats["uptime_start"]).total_seconds()
-        uptime_formatted = f"{int(uptime // 3600)}h {int((uptime % 3600) // 60)}m {int(uptime % 60)}s"
-        
-        # Generate HTML without problematic f-string CSS
-        html_template = '''
-<!DOCTYPE html>
-<html>
-<head>
-    <title>WhisperS2T Admin Panel</title>
-    <meta charset="utf-8">
-    <style>
-''' + ADMIN_CSS + '''
-    </style>
-</head>
-<body>
-    <nav class="nav-header">
-        <div class="nav-container">
-            <div class="nav-title">🎤 WhisperS2T Admin Panel</div>
-            <div class="nav-links">
-                <a href="/" title="Main Interface">🏠 Home</a>
-                <a href="/admin" class="active" title="Admin Panel">⚙️ Admin</a>
-                <a href="/docs" title="API Documentation">📚 API Docs</a>
-            </div>
-        </div>
-    </nav>
-    
-    <div class="container">
-        <h1>🎛️ System Administration</h1>
-        
-        <div class="stats-grid">
-            <div class="stat-card">
-                <h3>📊 System Status</h3>
-                <div class="stat-value">''' + ("✅ ONLINE" if self.whisper_available else "❌ OFFLINE") + '''</div>
-                <div class="stat-label">Whisper Model Status</div>
-                <table>
-                    <tr><td>Uptime:</td><td>''' + uptime_formatted + '''</td></tr>
-                    <tr><td>Total Transcriptions:</td><td>''' + str(self.system_stats.get("total_transcriptions", 0)) + '''</td></tr>
-                    <tr><td>Active Connections:</td><td>''' + str(len(self.connected_clients)) + '''</td></tr>
-                </table>
-            </div>
-            
-            <div class="stat-card">
-                <h3>🔄 System Updates</h3>
-                <div class="update-management">
-                    <div class="current-version" style="margin-bottom: 15px;">
-                        <strong>Current Version:</strong> 
-                        <span id="current-version-display">v1.1.0</span>
-                        <span id="update-status-indicator" style="margin-left: 10px; font-style: italic; color: #666;"></span>
-                    </div>
-                    
-                    <div class="update-controls" style="margin: 15px 0;">
-                        <button id="check-updates-btn" onclick="checkForUpdates()" 
-                                style="margin-right: 10px; padding: 12px 20px; background: #17a2b8; color: white; border: none; border-radius: 6px; cursor: pointer;">
-                            🔍 Check for Updates
-                        </button>
-                        <button id="apply-updates-btn" onclick="applyUpdates()" 
-                                style="margin-right: 10px; padding: 12px 20px; background: #28a745; color: white; border: none; border-radius: 6px; cursor: pointer;" 
-                                disabled>
-                            ⬇ Install Updates
-                        </button>
-                        <button id="rollback-btn" onclick="rollbackUpdate()" 
-                                style="padding: 12px 20px; background: #dc3545; color: white; border: none; border-radius: 6px; cursor: pointer;">
-                            ↩ Rollback
-                        </button>
-                    </div>
-                    
-                    <div id="update-status" style="margin: 15px 0;">
-                        <span id="update-status-text">Click "Check for Updates" to see if updates are available</span>
-                    </div>
-                    
-                    <div id="update-progress" style="margin-top: 15px; display: none;">
-                        <div style="background: #f0f0f0; border-radius: 4px; padding: 2px;">
-                            <div id="update-progress-bar" style="background: #007bff; height: 20px; border-radius: 2px; width: 0%; transition: width 0.3s;"></div>
-                        </div>
-                    </div>
-                    
-                    <div id="update-details" style="margin-top: 15px; display: none;">
-                        <h4>Update Information:</h4>
-                        <div id="update-info-content"></div>
-                    </div>
-                    
-                    <div id="update-log" style="margin-top: 15px; display: none;">
-                        <h4>Update Log:</h4>
-                        <div id="update-log-content" style="max-height: 200px; overflow-y: auto; background: #f8f9fa; padding: 10px; border: 1px solid #ddd; border-radius: 4px; font-family: monospace; font-size: 0.9em;">
-                        </div>
-                    </div>
-                    
-                    <div class="update-info" style="margin-top: 15px; padding: 12px; background: #e8f5e8; border-radius: 4px; font-size: 14px;">
-                        <strong>🔄 Update System:</strong><br>
-                        • Git-based updates with automatic detection<br>
-                        • Backup and rollback support<br>
-                        • Version tracking and commit history<br>
-                        • Production-ready deployment<br>
-                        • Automatic service restart<br>
-                        • Modular architecture
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <button id="themeToggle" onclick="toggleTheme()">🌙</button>
-    
-    <script>
-    let currentUpdateInfo = null;
-    
-    async function checkForUpdates() {
-        const checkBtn = document.getElementById('check-updates-btn');
-        const statusText = document.getElementById('update-status-text');
-        const applyBtn = document.getElementById('apply-updates-btn');
-        
-        try {
-            checkBtn.disabled = true;
-            checkBtn.innerHTML = '🔄 Checking...';
-            statusText.innerHTML = 'Checking for updates...';
-            
-            const response = await fetch('/api/update/check');
-            const data = await response.json();
-            
-            if (data.update_available) {
-                statusText.innerHTML = '✅ Update available!';
-                currentUpdateInfo = data;
-                applyBtn.disabled = false;
-                
-                // Show update details
-                const detailsDiv = document.getElementById('update-details');
-                const infoContent = document.getElementById('update-info-content');
-                detailsDiv.style.display = 'block';
-                
-                infoContent.innerHTML = '<p><strong>Current:</strong> ' + data.current_version.substring(0, 7) + '</p>' +
-                    '<p><strong>Latest:</strong> ' + data.latest_version.substring(0, 7) + '</p>' +
-                    '<p><strong>Message:</strong> ' + data.update_info.message + '</p>' +
-                    '<p><strong>Author:</strong> ' + data.update_info.author + '</p>' +
-                    '<p><strong>Date:</strong> ' + new Date(data.update_info.date).toLocaleString() + '</p>';
-            } else {
-                statusText.innerHTML = '✓ System is up to date';
-                applyBtn.disabled = true;
-            }
-            
-            // Update version display
-            document.getElementById('current-version-display').innerHTML = 
-                data.current_version.substring(0, 7);
-            
-        } catch (error) {
-            statusText.innerHTML = '❌ Check failed: ' + error.message;
-        } finally {
-            checkBtn.disabled = false;
-            checkBtn.innerHTML = '🔍 Check for Updates';
-        }
-    }
-    
-    async function applyUpdates() {
-        if (!currentUpdateInfo || !currentUpdateInfo.update_available) {
-            alert('No updates available');
-            return;
-        }
-        
-        if (!confirm('Apply update now?\\n\\nThis will:\\n• Create a backup\\n• Install the update\\n• Restart the service if needed\\n\\nContinue?')) {
-            return;
-        }
-        
-        const applyBtn = document.getElementById('apply-updates-btn');
-        const statusText = document.getElementById('update-status-text');
-        const progressDiv = document.getElementById('update-progress');
-        const progressBar = document.getElementById('update-progress-bar');
-        const logDiv = document.getElementById('update-log');
-        const logContent = document.getElementById('update-log-content');
-        
-        try {
-            applyBtn.disabled = true;
-            applyBtn.innerHTML = '🔄 Installing...';
-            progressDiv.style.display = 'block';
-            logDiv.style.display = 'block';
-            
-            progressBar.style.width = '20%';
-            statusText.innerHTML = 'Creating backup...';
-            logContent.innerHTML += '[' + new Date().toLocaleTimeString() + '] Starting update process...\\n';
-            
-            const response = await fetch('/api/update/install', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' }
-            });
-            
-            progressBar.style.width = '60%';
-            statusText.innerHTML = 'Installing update...';
-            logContent.innerHTML += '[' + new Date().toLocaleTimeString() + '] Installing updates...\\n';
-            
-            const data = await response.json();
-            
-            if (data.success) {
-                progressBar.style.width = '100%';
-                statusText.innerHTML = '✅ Update installed successfully!';
-                logContent.innerHTML += '[' + new Date().toLocaleTimeString() + '] ' + data.message + '\\n';
-                
-                if (data.restart_required) {
-                    logContent.innerHTML += '[' + new Date().toLocaleTimeString() + '] Service restart required\\n';
-                    setTimeout(() => {
-                        alert('Update completed! The service will restart now.');
-                        location.reload();
-                    }, 2000);
-                }
-            } else {
-                throw new Error(data.message || 'Update failed');
-            }
-            
-        } catch (error) {
-            progressBar.style.width = '0%';
-            statusText.innerHTML = '❌ Update failed: ' + error.message;
-            logContent.innerHTML += '[' + new Date().toLocaleTimeString() + '] ERROR: ' + error.message + '\\n';
-            alert('Update failed: ' + error.message);
-        } finally {
-            applyBtn.disabled = false;
-            applyBtn.innerHTML = '⬇ Install Updates';
-        }
-    }
-    
-    async function rollbackUpdate() {
-        const response = await fetch('/api/update/backups');
-        const data = await response.json();
-        
-        if (!data.backups || data.backups.length === 0) {
-            alert('No backups available');
-            return;
-        }
-        
-        const backup = prompt('Enter backup name to rollback to:\\n\\n' + 
-            data.backups.map(b => b.name + ' (' + new Date(b.date).toLocaleString() + ')').join('\\n'));
-        
-        if (!backup) return;
-        
-        if (!confirm('Rollback to ' + backup + '?\\n\\nThis will restore the previous version.')) {
-            return;
-        }
-        
-        try {
-            const response = await fetch('/api/update/rollback', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ backup_name: backup })
-            });
-            
-            const data = await response.json();
-            
-            if (data.success) {
-                alert('Rollback successful! The page will reload.');
-                location.reload();
-            } else {
-                throw new Error(data.message);
-            }
-        } catch (error) {
-            alert('Rollback failed: ' + error.message);
-        }
-    }
-    
-    function toggleTheme() {
-        const body = document.body;
-        const toggle = document.getElementById('themeToggle');
-        
-        if (body.getAttribute('data-theme') === 'dark') {
-            body.removeAttribute('data-theme');
-            toggle.textContent = '🌙';
-            localStorage.setItem('theme', 'light');
-        } else {
-            body.setAttribute('data-theme', 'dark');
-            toggle.textContent = '☀️';
-            localStorage.setItem('theme', 'dark');
-        }
-    }
-    
-    // Load saved theme on page load
-    document.addEventListener('DOMContentLoaded', function() {
-        const savedTheme = localStorage.getItem('theme');
-        const toggle = document.getElementById('themeToggle');
-        
-        if (savedTheme === 'dark') {
-            document.body.setAttribute('data-theme', 'dark');
-            toggle.textContent = '☀️';
-        } else {
-            toggle.textContent = '🌙';
-        }
-    });
-    
-    // Auto-check for updates on page load
-    window.addEventListener('load', () => {
-        setTimeout(checkForUpdates, 1000);
-    });
-    </script>
-</body>
-</html>
-'''
-        
-        return html_template
 
-    def _get_model_download_status_rows(self):
-        """Generate HTML table rows for model download status"""
-        try:
-            available_models = self.model_manager.get_available_models()
-            downloaded_models = getattr(self.model_manager, 'downloaded_models', set())
-            
-            if not available_models:
-                return '<tr><td colspan="4" style="padding: 8px; border: 1px solid #ddd; text-align: center;">No models available</td></tr>'
-            
-            rows_html = ""
-            for model_id, model_info in available_models.items():
-                status = "📦 Downloaded" if model_id in downloaded_models else "⬇️ Need Download"
-                
-                rows_html += f'''
-                <tr>
-                    <td style="padding: 8px; border: 1px solid #ddd;"><strong>{model_info["name"]}</strong></td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{status}</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{model_info.get("size", "Unknown")}</td>
-                    <td style="padding: 8px; border: 1px solid #ddd;">{model_info.get("description", "No description")}</td>
-                </tr>'''
-            
-            return rows_html
-        except Exception as e:
-            return f'<tr><td colspan="4" style="padding: 8px; border: 1px solid #ddd; text-align: center;">Error loading model status: {e}</td></tr>'
+# Stylesheet served from /static/admin.css so browsers cache it across admin page loads,
+# the page links it with a content-hash query so a changed stylesheet gets a new URL
+ADMIN_CSS_BYTES = minify_css(ADMIN_CSS).encode("utf-8")
+ADMIN_CSS_ETAG = hashlib.sha1(ADMIN_CSS_BYTES).hexdigest()
+ADMIN_CSS_GZ = gzip.compress(ADMIN_CSS_BYTES, compresslevel=9, mtime=0)
+
+# Pre-resolved labels for the Whisper availability flag
+STATUS_LABELS = {True: "✅ Online", False: "❌ Offline"}
+AVAILABLE_LABELS = {True: "Yes", False: "No"}
 
-    def _get_update_management_html(self):
-        """Generate HTML for update management section"""
-        return '''
+# Update management card (static)
+UPDATE_MANAGEMENT_HTML = '''
         <div class="stat-card">
             <h3>🔄 System Updates</h3>
             <div class="update-management">
@@ -559,250 +231,66 @@ class AdminPanel:
                     <div id="update-log-content" style="max-height: 200px; overflow-y: auto; background: #f8f9fa; padding: 10px; border: 1px solid #ddd; border-radius: 4px; font-family: monospace; font-size: 0.9em;">
                     </div>
                 </div>
-                
-                <div class="update-info" style="margin-top: 15px; padding: 12px; background: #e8f5e8; border-radius: 4px; font-size: 14px;">
-                    <strong>🔄 Update System:</strong><br>
-                    • Git-based updates with automatic detection<br>
-                    • Backup and rollback support<br>
-                    • Version tracking and commit history<br>
-                    • Production-ready deployment<br>
-                    • Automatic service restart<br>
-                    • Modular architecture
-                </div>
-            </div>
-        </div>
-        '''
-
-    def _get_chat_history_stats_html(self):
-        """Generate HTML for chat history statistics"""
-        try:
-            stats = self.chat_history.get_statistics()
-
-            stats_html = f'''
-                <div class="stats-grid" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px; margin: 15px 0;">
-                    <div style="padding: 10px; background: #e8f5e8; border-radius: 5px;">
-                        <div style="font-size: 1.5em; font-weight: bold;">{stats.get('total_transcriptions', 0)}</div>
-                        <div style="font-size: 0.9em; color: #666;">Total Transcriptions</div>
-                    </div>
-                    <div style="padding: 10px; background: #e8f4fd; border-radius: 5px;">
-                        <div style="font-size: 1.5em; font-weight: bold;">{stats.get('last_24h', 0)}</div>
-                        <div style="font-size: 0.9em; color: #666;">Last 24 Hours</div>
-                    </div>
-                </div>
-                
-                <div style="margin-top: 15px;">
-                    <h4>By Source Type:</h4>
-                    <ul style="margin: 5px 0;">
-                        {"".join([f"<li>{source}: {count} transcriptions</li>" for source, count in stats.get('source_breakdown', {}).items()])}
-                    </ul>
-                    
-                    <h4>By Model:</h4>
-                    <ul style="margin: 5px 0;">
-                        {"".join([f"<li>{model}: {count} transcriptions</li>" for model, count in stats.get('model_breakdown', {}).items()])}
-                    </ul>
-                </div>
-            '''
-            return stats_html
-        except Exception as e:
-            return f"<p>Error loading statistics: {e}</p>"
-
-    def _get_chat_history_stats_html(self):
-        """Generate HTML for chat history statistics"""
-        try:
-            stats = self.chat_history.get_statistics()
-
-            stats_html = f'''
-                <div class="stats-grid" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px; margin: 15px 0;">
-                    <div style="padding: 10px; background: #e8f5e8; border-radius: 5px;">
-                        <div style="font-size: 1.5em; font-weight: bold;">{stats.get('total_transcriptions', 0)}</div>
-                        <div style="font-size: 0.9em; color: #666;">Total Transcriptions</div>
-                    </div>
-                    <div style="padding: 10px; background: #e8f4fd; border-radius: 5px;">
-                        <div style="font-size: 1.5em; font-weight: bold;">{stats.get('last_24h', 0)}</div>
-                        <div style="font-size: 0.9em; color: #666;">Last 24 Hours</div>
-                    </div>
-                </div>
-                
-                <div style="margin-top: 15px;">
-                    <h4>By Source Type:</h4>
-                    <ul style="margin: 5px 0;">
-                        {"".join([f"<li>{source}: {count} transcriptions</li>" for source, count in stats.get('source_breakdown', {}).items()])}
-                    </ul>
-                    
-                    <h4>By Model:</h4>
-                    <ul style="margin: 5px 0;">
-                        {"".join([f"<li>{model}: {count} transcriptions</li>" for model, count in stats.get('model_breakdown', {}).items()])}
-                    </ul>
-                </div>
-            '''
-            return stats_html
-        except Exception as e:
-            return f"<p>Error loading statistics: {e}</p>"
-
-    def get_admin_interface(self):
-        """Enhanced Admin Panel with all original features restored"""
-        uptime = (datetime.now() - self.system_stats["uptime_start"]).total_seconds()
-        uptime_formatted = f"{int(uptime // 3600)}h {int((uptime % 3600) // 60)}m {int(uptime % 60)}s"
-        
-        # Generate HTML without problematic f-string CSS
-        html_template = '''
-<!DOCTYPE html>
-<html>
-<head>
-    <title>WhisperS2T Admin Panel</title>
-    <meta charset="utf-8">
-    <meta http-equiv="refresh" content="30">
-    <style>
-''' + ADMIN_CSS + '''
-    </style>
-</head>
-<body>
-    <!-- Navigation Header -->
-    <div class="nav-header">
-        <div class="nav-container">
-            <div class="nav-title">🎤 WhisperS2T Control Center</div>
-            <div class="nav-links">
-                <a href="/" class="nav-link">🏠 Home</a>
-                <a href="/admin" class="nav-link active">⚙️ Admin</a>
-                <a href="/docs" class="nav-link">📚 API Docs</a>
-                <a href="/health" class="nav-link">🏥 Health</a>
-            </div>
-        </div>
-    </div>
-    
-    <div class="container">
-        <div class="header">
-            <h1>⚙️ System Administration Dashboard</h1>
-            <p>Real-time monitoring and system control interface</p>
-        </div>
-        
-        <!-- Quick Actions -->
-        <div class="quick-actions">
-            <h3>🚀 Quick Actions</h3>
-            <div class="action-buttons">
-                <a href="/health" class="btn btn-success">🏥 Health Check</a>
-                <a href="/api/status" class="btn btn-info">📊 API Status</a>
-                <a href="/docs" class="btn btn-primary">📚 API Documentation</a>
-            </div>
-        </div>
-        
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-value status-good">''' + ("✅ Online" if self.whisper_available else "❌ Offline") + '''</div>
-                <div class="stat-label">Whisper Service Status</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-value">''' + uptime_formatted + '''</div>
-                <div class="stat-label">System Uptime</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-value">''' + str(self.system_stats['total_transcriptions']) + '''</div>
-                <div class="stat-label">Total Transcriptions</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-value">''' + str(len(self.connected_clients)) + '''</div>
-                <div class="stat-label">Active WebSocket Connections</div>
-            </div>
-        </div>
-        
-        <!-- Model Management Section -->
-        <div class="stat-card">
-            <h3>🧠 Whisper Model Management</h3>
-            <div class="model-management">
-                <div class="current-model">
-                    <strong>Current Model:</strong> 
-                    <span id="current-model-name">''' + self._safe_get_current_model() + '''</span>
-                    <span id="model-loading-indicator" style="color: #007bff; font-style: italic;">
-                        ''' + ("(Loading...)" if self._safe_is_loading() else "") + '''
-                    </span>
-                </div>
-                
-                <div class="model-selector" style="margin: 15px 0;">
-                    <label for="admin-model-select"><strong>Switch Model:</strong></label>
-                    <select id="admin-model-select" style="margin-left: 10px; padding: 5px;">
-                        ''' + self._get_model_options() + '''
-                    </select>
-                    <button onclick="switchAdminModel()" style="margin-left: 10px; padding: 5px 10px; background: #007bff; color: white; border: none; border-radius: 3px; cursor: pointer;">
-                        Switch Model
-                    </button>
-                </div>
-                
-                <div id="admin-model-status" style="margin-top: 10px; font-size: 0.9em;"></div>
-                
-                <div class="model-details" style="margin-top: 15px;">
-                    <h4>Available Models:</h4>
-                    <table style="width: 100%; margin-top: 10px; border-collapse: collapse;">
-                        <tr style="background: #f8f9fa;">
-                            <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Model</th>
-                            <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Size</th>
-                            <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Speed</th>
-                            <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Quality</th>
-                            <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Description</th>
-                        </tr>
-                        ''' + self._get_model_table_rows() + '''
-                    </table>
-                </div>
-            </div>
-        </div>
-        
-        ''' + self._get_update_management_html() + '''
-        
-        <div class="stat-card">
-            <h3>🔧 System Information</h3>
-            <table>
-                <tr><th>Property</th><th>Value</th></tr>
-                <tr><td>Service Name</td><td>WhisperS2T Enhanced Appliance</td></tr>
-                <tr><td>Version</td><td>1.1.0</td></tr>
-                <tr><td>Framework</td><td>Flask + SocketIO + SQLite</td></tr>
-                <tr><td>Whisper Available</td><td>''' + ("Yes" if self.whisper_available else "No") + '''</td></tr>
-                <tr><td>Model Type</td><td>''' + self._safe_get_current_model() + '''</td></tr>
-                <tr><td>Architecture</td><td>Modular (live_speech, upload_handler, admin_panel, api_docs, chat_history)</td></tr>
-                <tr><td>Features</td><td>Live Speech, Upload Transcription, WebSocket, API Docs, Chat History, Update System</td></tr>
-            </table>
-        </div>
-        
-        <!-- Model Download Status Section -->
-        <div class="stat-card">
-            <h3>📊 Model Download Status</h3>
-            <div class="model-download-status">
-                <table style="width: 100%; margin-top: 10px; border-collapse: collapse;">
-                    <tr style="background: #f8f9fa;">
-                        <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Model</th>
-                        <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Status</th>
-                        <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Size</th>
-                        <th style="padding: 8px; border: 1px solid #ddd; text-align: left;">Description</th>
-                    </tr>
-                    ''' + self._get_model_download_status_rows() + '''
-                </table>
-            </div>
-        </div>
-        
-        <div class="stat-card">
-            <h3>💬 Chat History Statistics</h3>
-            <div class="chat-history-stats">
-                ''' + self._get_chat_history_stats_html() + '''
-                <div style="margin-top: 15px;">
-                    <button onclick="loadChatHistory()" style="margin-right: 10px; padding: 5px 10px; background: #007bff; color: white; border: none; border-radius: 3px; cursor: pointer;">
-                        📜 View Recent History
-                    </button>
-                    <button onclick="exportChatHistory('json')" style="margin-right: 10px; padding: 5px 10px; background: #28a745; color: white; border: none; border-radius: 3px; cursor: pointer;">
-                        📤 Export JSON
-                    </button>
-                    <button onclick="exportChatHistory('csv')" style="padding: 5px 10px; background: #ffc107; color: black; border: none; border-radius: 3px; cursor: pointer;">
-                        📤 Export CSV
-                    </button>
-                </div>
-                <div id="chat-history-content" style="margin-top: 15px; max-height: 400px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; background: #f8f9fa; display: none;">
-                    <!-- Chat history will be loaded here -->
+                
+                <div class="update-info" style="margin-top: 15px; padding: 12px; background: #e8f5e8; border-radius: 4px; font-size: 14px;">
+                    <strong>🔄 Update System:</strong><br>
+                    • Git-based updates with automatic detection<br>
+                    • Backup and rollback support<br>
+                    • Version tracking and commit history<br>
+                    • Production-ready deployment<br>
+                    • Automatic service restart<br>
+                    • Modular architecture
                 </div>
             </div>
         </div>
+        '''
+
+# Navigation header shared by the control center pages - {home}/{admin}/... mark the active link
+NAV_HEADER = '''<div class="nav-header">
+        <div class="nav-container">
+            <div class="nav-title">🎤 WhisperS2T Control Center</div>
+            <div class="nav-links">
+                <a href="/" class="nav-link{home}">🏠 Home</a>
+                <a href="/admin" class="nav-link{admin}">⚙️ Admin</a>
+                <a href="/docs" class="nav-link{docs}">📚 API Docs</a>
+                <a href="/health" class="nav-link{health}">🏥 Health</a>
+            </div>
+        </div>
     </div>
-    
-    <script>
+'''
+NAV_PAGES = ("home", "admin", "docs", "health")
+
+
+@functools.lru_cache(maxsize=8)
+def render_nav(active: str) -> str:
+    """Navigation header with the link of the active page highlighted"""
+    return NAV_HEADER.format(**{page: " active" if page == active else "" for page in NAV_PAGES})
+
+
+
+def stat_card(value: str, label: str, element_id: str, css_class: str = "") -> str:
+    """Skeleton markup for one stat card - value is a %(field)s placeholder or text the stats poller replaces"""
+    return f'''
+            <div class="stat-card">
+                <div class="stat-value{css_class}" id="{element_id}">{value}</div>
+                <div class="stat-label">{label}</div>
+            </div>
+            '''
+
+
+# Stat cards at the top of the admin page, updated in place by the stats poller
+STAT_CARDS = "".join(
+    [
+        stat_card("%(status)s", "Whisper Service Status", "stat-status", " status-good"),
+        # Uptime changes every second, so it is left to the stats poller and the page stays cacheable
+        stat_card("…", "System Uptime", "stat-uptime"),
+        stat_card("%(total_transcriptions)s", "Total Transcriptions", "stat-total"),
+        stat_card("%(active_connections)s", "Active WebSocket Connections", "stat-clients"),
+    ]
+)
+
+# Admin page script served from /static/admin.js
+ADMIN_JS = '''
         // Model Management JavaScript
         async function switchAdminModel() {
             const modelSelect = document.getElementById('admin-model-select');
@@ -851,8 +339,39 @@ class AdminPanel:
             }
         }
         
-        // Model status update interval
-        setInterval(async () => {
+        // Model selector and table, filled from /api/models once the page has loaded
+        async function loadModels() {
+            const modelSelect = document.getElementById('admin-model-select');
+            const tableBody = document.getElementById('model-table-body');
+            try {
+                const response = await fetch('/api/models');
+                const data = await response.json();
+                const models = Object.entries(data.available_models || {});
+                
+                modelSelect.replaceChildren(...models.map(([modelId, info]) =>
+                    new Option(`${info.name || modelId} (${info.size || 'Unknown'})`, modelId, false, modelId === data.current_model)));
+                if (!models.length) {
+                    modelSelect.replaceChildren(new Option('No models available', ''));
+                }
+                
+                tableBody.replaceChildren();
+                for (const [modelId, info] of models) {
+                    const row = tableBody.insertRow();
+                    const values = [info.name || modelId, info.size || 'Unknown', info.speed || 'Unknown', info.quality || 'Unknown', info.description || 'No description'];
+                    values.forEach((value, index) => {
+                        const cell = row.insertCell();
+                        const target = index === 0 ? cell.appendChild(document.createElement('strong')) : cell;
+                        target.textContent = value;
+                    });
+                }
+            } catch (error) {
+                console.error('Loading models failed:', error);
+                modelSelect.replaceChildren(new Option('Models unavailable', ''));
+            }
+        }
+        
+        // Model status shown next to the selector
+        async function refreshModelStatus() {
             try {
                 const response = await fetch('/api/models');
                 const data = await response.json();
@@ -871,7 +390,7 @@ class AdminPanel:
             } catch (error) {
                 console.error('Model status update failed:', error);
             }
-        }, 30000);
+        }
         
         // Chat History Functions
         async function loadChatHistory() {
@@ -892,9 +411,9 @@ class AdminPanel:
                         historyHtml += `
                             <div style="border-bottom: 1px solid #ddd; padding: 10px; margin: 5px 0;">
                                 <div style="font-size: 0.9em; color: #666;">
-                                    \${date} | \${trans.source_type} | \${trans.model_used || 'unknown'}
+                                    ${date} | ${trans.source_type} | ${trans.model_used || 'unknown'}
                                 </div>
-                                <div style="margin-top: 5px;">\${trans.text}</div>
+                                <div style="margin-top: 5px;">${trans.text}</div>
                             </div>
                         `;
                     });
@@ -1094,11 +613,414 @@ class AdminPanel:
         
         // Auto-check for updates on page load
         window.addEventListener('load', () => {
+            loadModels();
+            refreshStats();
             setTimeout(checkForUpdates, 1000);
         });
-    </script>
+        
+        // Stat card values
+        async function refreshStats() {
+            try {
+                const response = await fetch('/api/admin/stats');
+                const data = await response.json();
+                document.getElementById('stat-status').textContent = data.status;
+                document.getElementById('stat-uptime').textContent = data.uptime;
+                document.getElementById('stat-total').textContent = data.total;
+                document.getElementById('stat-clients').textContent = data.clients;
+            } catch (error) {
+                console.error('Stats refresh failed:', error);
+            }
+        }
+        
+        // One timer refreshes the model status and stat cards in place instead of reloading the whole page
+        setInterval(() => {
+            refreshModelStatus();
+            refreshStats();
+        }, 30000);
+'''
+ADMIN_JS_BYTES = ADMIN_JS.encode("utf-8")
+ADMIN_JS_ETAG = hashlib.sha1(ADMIN_JS_BYTES).hexdigest()
+ADMIN_JS_GZ = gzip.compress(ADMIN_JS_BYTES, compresslevel=9, mtime=0)
+
+# Admin page skeleton - %(name)s marks the fields that change per request, literal % is %%
+ADMIN_PAGE = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <title>WhisperS2T Admin Panel</title>
+    <meta charset="utf-8">
+    <link rel="stylesheet" href="/static/admin.css?v=''' + ADMIN_CSS_ETAG[:12] + '''">
+</head>
+<body>
+    <!-- Navigation Header -->
+    ''' + render_nav("admin") + '''
+    
+    <div class="container">
+        <div class="header">
+            <h1>⚙️ System Administration Dashboard</h1>
+            <p>Real-time monitoring and system control interface</p>
+        </div>
+        
+        <!-- Quick Actions -->
+        <div class="quick-actions">
+            <h3>🚀 Quick Actions</h3>
+            <div class="action-buttons">
+                <a href="/health" class="btn btn-success">🏥 Health Check</a>
+                <a href="/api/status" class="btn btn-info">📊 API Status</a>
+                <a href="/docs" class="btn btn-primary">📚 API Documentation</a>
+            </div>
+        </div>
+        
+        <div class="stats-grid">''' + STAT_CARDS + '''
+        </div>
+        
+        <!-- Model Management Section -->
+        <div class="stat-card">
+            <h3>🧠 Whisper Model Management</h3>
+            <div class="model-management">
+                <div class="current-model">
+                    <strong>Current Model:</strong> 
+                    <span id="current-model-name">%(current_model)s</span>
+                    <span id="model-loading-indicator" style="color: #007bff; font-style: italic;">
+                        %(loading)s
+                    </span>
+                </div>
+                
+                <div class="model-selector" style="margin: 15px 0;">
+                    <label for="admin-model-select"><strong>Switch Model:</strong></label>
+                    <select id="admin-model-select" style="margin-left: 10px; padding: 5px;">
+                        <option value="">Loading models...</option>
+                    </select>
+                    <button onclick="switchAdminModel()" style="margin-left: 10px; padding: 5px 10px; background: #007bff; color: white; border: none; border-radius: 3px; cursor: pointer;">
+                        Switch Model
+                    </button>
+                </div>
+                
+                <div id="admin-model-status" style="margin-top: 10px; font-size: 0.9em;"></div>
+                
+                <div class="model-details" style="margin-top: 15px;">
+                    <h4>Available Models:</h4>
+                    <table class="model-table">
+                        <thead>
+                        <tr class="table-head">
+                            <th>Model</th>
+                            <th>Size</th>
+                            <th>Speed</th>
+                            <th>Quality</th>
+                            <th>Description</th>
+                        </tr>
+                        </thead>
+                        <tbody id="model-table-body"></tbody>
+                    </table>
+                </div>
+            </div>
+        </div>
+        
+        ''' + UPDATE_MANAGEMENT_HTML.replace("%", "%%") + '''
+        
+        <div class="stat-card">
+            <h3>🔧 System Information</h3>
+            <table>
+                <tr><th>Property</th><th>Value</th></tr>
+                <tr><td>Service Name</td><td>WhisperS2T Enhanced Appliance</td></tr>
+                <tr><td>Version</td><td>1.1.0</td></tr>
+                <tr><td>Framework</td><td>Flask + SocketIO + SQLite</td></tr>
+                <tr><td>Whisper Available</td><td>%(whisper_available)s</td></tr>
+                <tr><td>Model Type</td><td>%(current_model)s</td></tr>
+                <tr><td>Architecture</td><td>Modular (live_speech, upload_handler, admin_panel, api_docs, chat_history)</td></tr>
+                <tr><td>Features</td><td>Live Speech, Upload Transcription, WebSocket, API Docs, Chat History, Update System</td></tr>
+            </table>
+        </div>
+        
+        <!-- Model Download Status Section -->
+        <div class="stat-card">
+            <h3>📊 Model Download Status</h3>
+            <div class="model-download-status">
+                <table class="model-table">
+                    <tr class="table-head">
+                        <th>Model</th>
+                        <th>Status</th>
+                        <th>Size</th>
+                        <th>Description</th>
+                    </tr>
+                    %(download_status_rows)s
+                </table>
+            </div>
+        </div>
+        
+        <div class="stat-card">
+            <h3>💬 Chat History Statistics</h3>
+            <div class="chat-history-stats">
+                %(chat_history_stats)s
+                <div style="margin-top: 15px;">
+                    <button onclick="loadChatHistory()" style="margin-right: 10px; padding: 5px 10px; background: #007bff; color: white; border: none; border-radius: 3px; cursor: pointer;">
+                        📜 View Recent History
+                    </button>
+                    <button onclick="exportChatHistory('json')" style="margin-right: 10px; padding: 5px 10px; background: #28a745; color: white; border: none; border-radius: 3px; cursor: pointer;">
+                        📤 Export JSON
+                    </button>
+                    <button onclick="exportChatHistory('csv')" style="padding: 5px 10px; background: #ffc107; color: black; border: none; border-radius: 3px; cursor: pointer;">
+                        📤 Export CSV
+                    </button>
+                </div>
+                <div id="chat-history-content" style="margin-top: 15px; max-height: 400px; overflow-y: auto; border: 1px solid #ddd; padding: 10px; background: #f8f9fa; display: none;">
+                    <!-- Chat history will be loaded here -->
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <script src="/static/admin.js?v=''' + ADMIN_JS_ETAG[:12] + '''"></script>
 </body>
 </html>
 '''
-        
-        return html_template
+
+# Split once into static segments (pre-encoded UTF-8) and the field names between them:
+# the page is ADMIN_SEGMENTS[0], value(ADMIN_FIELDS[0]), ADMIN_SEGMENTS[1], ...
+_ADMIN_PARTS = re.split(r"%\((\w+)\)s", ADMIN_PAGE)
+ADMIN_SEGMENTS = [minify_html(part.replace("%%", "%")).encode("utf-8") for part in _ADMIN_PARTS[0::2]]
+ADMIN_FIELDS = _ADMIN_PARTS[1::2]
+
+
+@functools.lru_cache(maxsize=1)
+def format_uptime(total_seconds: int) -> str:
+    """Format whole seconds as "Xh Ym Zs" - back-to-back requests in the same second reuse the string"""
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}h {minutes}m {seconds}s"
+
+
+# Time-based figures on the page (chat history "Last 24 Hours") are re-rendered at least this often
+ADMIN_STATS_MAX_AGE = 60
+
+NO_MODELS_ROW = '<tr><td colspan="4" style="text-align: center;">No models available</td></tr>'
+
+
+@functools.lru_cache(maxsize=8)
+def render_download_status_rows(models: tuple, downloaded: frozenset) -> str:
+    """Download status rows for (id, name, size, description) tuples - rebuilt only when models or downloads change"""
+    rows = []
+    for model_id, name, size, description in models:
+        status = "📦 Downloaded" if model_id in downloaded else "⬇️ Need Download"
+        rows.append(f'''
+            <tr>
+                <td><strong>{escape(name)}</strong></td>
+                <td>{status}</td>
+                <td>{escape(size)}</td>
+                <td>{escape(description)}</td>
+            </tr>''')
+    return "".join(rows)
+
+
+def _encoded_response(body, body_gz, mimetype):
+    """Response carrying the precompressed body when the client accepts gzip"""
+    if request.accept_encodings["gzip"]:
+        response = Response(body_gz, mimetype=mimetype)
+        response.content_encoding = "gzip"
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _conditional_response(body, body_gz, etag, mimetype):
+    """Precompressed response with an ETag - 304 Not Modified when the client already has this body"""
+    response = _encoded_response(body, body_gz, mimetype)
+    response.set_etag(etag + ("-gz" if response.content_encoding == "gzip" else ""))
+    return response.make_conditional(request)
+
+
+def _static_asset_response(body, body_gz, etag, mimetype):
+    """Cacheable response for a static admin asset - the page links it by content hash"""
+    response = _conditional_response(body, body_gz, etag, mimetype)
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
+
+
+class AdminPanel:
+    """Fixed Admin Panel"""
+
+    __slots__ = (
+        "whisper_available",
+        "system_stats",
+        "connected_clients",
+        "model_manager",
+        "chat_history",
+        "update_manager",
+        "update_available",
+        "_rendered_page",
+    )
+    
+    def __init__(self, whisper_available, system_stats, connected_clients, model_manager, chat_history, update_manager=None):
+        self.whisper_available = whisper_available
+        self.system_stats = system_stats
+        self.connected_clients = connected_clients
+        self.model_manager = model_manager
+        self.chat_history = chat_history
+        self.update_manager = update_manager
+        self.update_available = update_manager is not None
+        self._rendered_page = (None, None)
+
+    def register_routes(self, app):
+        """Register admin panel routes"""
+        app.add_url_rule("/admin", "admin", self.serve_admin_interface)
+        app.add_url_rule("/static/admin.css", "admin_css", self.serve_admin_css)
+        app.add_url_rule("/static/admin.js", "admin_js", self.serve_admin_js)
+        app.add_url_rule("/api/admin/stats", "admin_stats", self.serve_admin_stats)
+
+    def serve_admin_interface(self):
+        """Admin page - one pre-encoded body, sent with a Content-Length and revalidated via ETag"""
+        response = _conditional_response(*self._get_rendered_page(), "text/html")
+        response.cache_control.no_cache = True
+        return response
+
+    def serve_admin_css(self):
+        """Admin stylesheet - static bytes, revalidated via ETag"""
+        return _static_asset_response(ADMIN_CSS_BYTES, ADMIN_CSS_GZ, ADMIN_CSS_ETAG, "text/css")
+
+    def serve_admin_js(self):
+        """Admin page script - static bytes, revalidated via ETag"""
+        return _static_asset_response(ADMIN_JS_BYTES, ADMIN_JS_GZ, ADMIN_JS_ETAG, "text/javascript")
+
+    def serve_admin_stats(self):
+        """Live stat card values for the admin page poller"""
+        return jsonify(self.get_admin_stats())
+
+    def get_admin_stats(self):
+        """Current values of the four stat cards"""
+        online = bool(self.whisper_available)
+        return {
+            "online": online,
+            "status": STATUS_LABELS[online],
+            "uptime": format_uptime(self._uptime_seconds()),
+            "total": self.system_stats["total_transcriptions"],
+            "clients": len(self.connected_clients),
+        }
+
+    def _uptime_seconds(self):
+        """Whole seconds since startup, immune to wall-clock adjustments"""
+        return int(time.monotonic() - self.system_stats["uptime_start_monotonic"])
+
+    def _safe_get_current_model(self):
+        """Safely get current model name with fallback"""
+        if self.model_manager:
+            try:
+                return self.model_manager.get_current_model_name() or "Not loaded"
+            except Exception:
+                return "Error loading model"
+        return "Model Manager unavailable"
+
+    def _safe_get_available_models(self):
+        """Safely get available models with fallback"""
+        if self.model_manager:
+            try:
+                return self.model_manager.get_available_models()
+            except Exception:
+                return {}
+        return {}
+
+    def _safe_is_loading(self):
+        """Safely check if model is loading"""
+        if self.model_manager:
+            try:
+                return self.model_manager.is_model_loading()
+            except Exception:
+                return False
+        return False
+
+    def get_admin_interface(self):
+        """Enhanced Admin Panel with all original features restored - the page as UTF-8 bytes"""
+        return self._get_rendered_page()[0]
+
+    def _get_rendered_page(self):
+        """Encoded admin page, its gzip form and ETag, reused while the page inputs are unchanged"""
+        state = (
+            bool(self.whisper_available),
+            self.system_stats["total_transcriptions"],
+            len(self.connected_clients),
+            self._safe_get_current_model(),
+            self._safe_is_loading(),
+            frozenset(getattr(self.model_manager, "downloaded_models", ())),
+        )
+        key = (
+            *state,
+            getattr(self.chat_history, "change_count", None),
+            int(time.monotonic() // ADMIN_STATS_MAX_AGE),
+        )
+        cached_key, rendered = self._rendered_page
+        if cached_key != key:
+            values = self._get_admin_values(*state)
+            parts = [ADMIN_SEGMENTS[0]]
+            for name, segment in zip(ADMIN_FIELDS, ADMIN_SEGMENTS[1:]):
+                parts.append(values[name].encode("utf-8"))
+                parts.append(segment)
+            page = b"".join(parts)
+            rendered = (page, gzip.compress(page, compresslevel=6, mtime=0), hashlib.sha1(page).hexdigest())
+            self._rendered_page = (key, rendered)
+        return rendered
+
+    def _get_admin_values(
+        self, whisper_available, total_transcriptions, active_connections, current_model, loading, downloaded_models
+    ):
+        """Live values for the admin page fields, built from the state the cache key was taken from"""
+        return {
+            "status": STATUS_LABELS[whisper_available],
+            "total_transcriptions": str(total_transcriptions),
+            "active_connections": str(active_connections),
+            "current_model": escape(current_model),
+            "loading": "(Loading...)" if loading else "",
+            "whisper_available": AVAILABLE_LABELS[whisper_available],
+            "download_status_rows": self._get_model_download_status_rows(downloaded_models),
+            "chat_history_stats": self._get_chat_history_stats_html(),
+        }
+
+    def _get_model_download_status_rows(self, downloaded_models):
+        """Generate HTML table rows for model download status"""
+        available_models = self._safe_get_available_models()
+        if not available_models:
+            return NO_MODELS_ROW
+
+        models = tuple(
+            (
+                model_id,
+                model_info.get("name", model_id),
+                model_info.get("size", "Unknown"),
+                model_info.get("description", "No description"),
+            )
+            for model_id, model_info in available_models.items()
+        )
+        return render_download_status_rows(models, downloaded_models)
+
+    def _get_chat_history_stats_html(self):
+        """Generate HTML for chat history statistics"""
+        try:
+            stats = self.chat_history.get_statistics()
+
+            stats_html = f'''
+                <div class="stats-grid" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px; margin: 15px 0;">
+                    <div style="padding: 10px; background: #e8f5e8; border-radius: 5px;">
+                        <div style="font-size: 1.5em; font-weight: bold;">{stats.get('total_transcriptions', 0)}</div>
+                        <div style="font-size: 0.9em; color: #666;">Total Transcriptions</div>
+                    </div>
+                    <div style="padding: 10px; background: #e8f4fd; border-radius: 5px;">
+                        <div style="font-size: 1.5em; font-weight: bold;">{stats.get('last_24h', 0)}</div>
+                        <div style="font-size: 0.9em; color: #666;">Last 24 Hours</div>
+                    </div>
+                </div>
+                
+                <div style="margin-top: 15px;">
+                    <h4>By Source Type:</h4>
+                    <ul style="margin: 5px 0;">
+                        {"".join([f"<li>{escape(str(source))}: {count} transcriptions</li>" for source, count in stats.get('source_breakdown', {}).items()])}
+                    </ul>
+                    
+                    <h4>By Model:</h4>
+                    <ul style="margin: 5px 0;">
+                        {"".join([f"<li>{escape(str(model))}: {count} transcriptions</li>" for model, count in stats.get('model_breakdown', {}).items()])}
+                    </ul>
+                </div>
+            '''
+            return stats_html
+        except Exception as e:
+            return f"<p>Error loading statistics: {escape(str(e))}</p>"
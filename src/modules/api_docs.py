@@ -4,9 +4,11 @@ Provides professional API documentation interface using SwaggerUI
 Replaces custom HTML with industry-standard documentation
 """
 
+import hashlib
+import json
 import logging
 
-from flask import jsonify, request
+from flask import Response, jsonify, request
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +16,11 @@ logger = logging.getLogger(__name__)
 class APIDocs:
     """Manages SwaggerUI API documentation interface"""
 
+    MAX_CACHED_SPECS = 16
+
     def __init__(self, version="0.8.0"):
         self.version = version
+        self._spec_cache = {}  # base_url -> (spec bytes, etag)
 
     def get_current_base_url(self, request_obj):
         """Get current base URL dynamically from request"""
@@ -210,6 +215,32 @@ class APIDocs:
 
         return openapi_spec
 
+    def get_openapi_spec_bytes(self, request_obj):
+        """Serialized OpenAPI spec and its ETag, built once per base URL"""
+        base_url = self.get_current_base_url(request_obj)
+        cached = self._spec_cache.get(base_url)
+        if cached is None:
+            spec_bytes = json.dumps(self.get_openapi_spec(request_obj)).encode("utf-8")
+            cached = (spec_bytes, hashlib.blake2b(spec_bytes, digest_size=8).hexdigest())
+            # The Host header is client-controlled, so keep the cache bounded
+            if len(self._spec_cache) >= self.MAX_CACHED_SPECS:
+                self._spec_cache.clear()
+            self._spec_cache[base_url] = cached
+        return cached
+
+    def serve_openapi_spec(self):
+        """OpenAPI 3.0 specification for SwaggerUI - pre-serialized, revalidated via ETag"""
+        spec_bytes, etag = self.get_openapi_spec_bytes(request)
+        response = Response(spec_bytes, mimetype="application/json")
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 60
+        return response.make_conditional(request)
+
+    def register_routes(self, app):
+        """Register API documentation routes"""
+        app.add_url_rule("/api/openapi.json", "openapi_spec", self.serve_openapi_spec)
+
     def get_swagger_config(self):
         """Get SwaggerUI configuration"""
         return {
@@ -0,0 +1,118 @@
+"""
+Audio Kernels Module
+Numeric helpers for live audio chunks
+Uses Numba-compiled loops when numba is installed, vectorized numpy otherwise
+"""
+
+import io
+import logging
+import wave
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Whisper models expect 16 kHz mono float32 audio
+WHISPER_SAMPLE_RATE = 16000
+
+# Centered moving-average length for high_pass - removes DC offset and rumble below ~70 Hz at 16 kHz
+HIGH_PASS_WINDOW = 101
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def int16_to_float32(buf):
+        """Convert int16 PCM samples to float32 in [-1.0, 1.0)"""
+        out = np.empty(buf.shape[0], np.float32)
+        for i in range(buf.shape[0]):
+            out[i] = buf[i] * (1.0 / 32768.0)
+        return out
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def rms(samples):
+        """Root mean square level of float32 samples"""
+        if samples.shape[0] == 0:
+            return 0.0
+        total = 0.0
+        for i in range(samples.shape[0]):
+            total += samples[i] * samples[i]
+        return np.sqrt(total / samples.shape[0])
+
+else:
+
+    def int16_to_float32(buf):
+        """Convert int16 PCM samples to float32 in [-1.0, 1.0)"""
+        return buf.astype(np.float32) * np.float32(1.0 / 32768.0)
+
+    def rms(samples):
+        """Root mean square level of float32 samples"""
+        if samples.shape[0] == 0:
+            return 0.0
+        return float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, nogil=True)
+    def high_pass(samples, window=HIGH_PASS_WINDOW):
+        """High-pass float32 samples by subtracting their centered moving average"""
+        n = samples.shape[0]
+        half = window // 2
+        prefix = np.empty(n + 1, np.float64)
+        prefix[0] = 0.0
+        for i in range(n):
+            prefix[i + 1] = prefix[i] + samples[i]
+        out = np.empty(n, np.float32)
+        for i in range(n):
+            lo = max(i - half, 0)
+            hi = min(i + half + 1, n)
+            out[i] = samples[i] - (prefix[hi] - prefix[lo]) / (hi - lo)
+        return out
+
+else:
+
+    def high_pass(samples, window=HIGH_PASS_WINDOW):
+        """High-pass float32 samples by subtracting their centered moving average"""
+        n = samples.shape[0]
+        half = window // 2
+        prefix = np.concatenate(([0.0], np.cumsum(samples, dtype=np.float64)))
+        index = np.arange(n)
+        lo = np.maximum(index - half, 0)
+        hi = np.minimum(index + half + 1, n)
+        return (samples - (prefix[hi] - prefix[lo]) / (hi - lo)).astype(np.float32)
+
+
+def decode_pcm16_wav(audio_bytes: bytes) -> Optional[np.ndarray]:
+    """Decode a 16 kHz mono 16-bit PCM WAV chunk into float32 samples
+
+    Returns None for any other container or format so callers can fall back to ffmpeg.
+    """
+    if audio_bytes[:4] != b"RIFF" or audio_bytes[8:12] != b"WAVE":
+        return None
+
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wav:
+            if wav.getnchannels() != 1 or wav.getsampwidth() != 2 or wav.getframerate() != WHISPER_SAMPLE_RATE:
+                return None
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    return int16_to_float32(np.frombuffer(frames, dtype="<i2"))
+
+
+def warmup_audio_kernels():
+    """Run the kernels once so JIT compilation happens before the first client"""
+    samples = int16_to_float32(np.zeros(WHISPER_SAMPLE_RATE, dtype=np.int16))
+    rms(samples)
+    high_pass(samples)
+    logger.info(f"Audio kernels ready ({'numba' if NUMBA_AVAILABLE else 'numpy'})")
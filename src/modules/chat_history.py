@@ -4,10 +4,12 @@ Simple SQLite-based chat history for transcriptions with robust fallback
 Stores all transcriptions with timestamps, models, and metadata
 """
 
+import json
 import logging
 import sqlite3
 import tempfile
 import threading
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -17,12 +19,19 @@ logger = logging.getLogger(__name__)
 class ChatHistoryManager:
     """Manages chat history using SQLite database with robust error handling"""
 
+    # Serialized /api/chat-history payloads are reused for this long unless a write invalidates them
+    JSON_CACHE_TTL = 1.0
+    MAX_CACHED_PAYLOADS = 32
+
     def __init__(self, db_path: str = None):
         import os
 
         self.db_path = None
         self.db_lock = threading.Lock()
         self.database_enabled = False
+        self._json_cache = {}
+        self._json_cache_lock = threading.Lock()
+        self.change_count = 0  # Bumped on every write so callers can cache derived views
 
         # Use different paths for development vs production
         if db_path is None:
@@ -147,6 +156,7 @@ class ChatHistoryManager:
                     """,
                         (text, language, model_used, source_type, filename, duration, confidence, metadata_json),
                     )
+                    self._invalidate_json_cache()
 
                     return cursor.lastrowid
 
@@ -177,6 +187,37 @@ class ChatHistoryManager:
             logger.error(f"Failed to get recent transcriptions: {e}")
             return []
 
+    def get_recent_transcriptions_json(self, limit: int = 50, source_type: str = None) -> bytes:
+        """Get the /api/chat-history response body as pre-serialized JSON bytes
+
+        The encoded payload is cached per (source_type, limit) until the next write or for JSON_CACHE_TTL seconds.
+        """
+        key = (source_type, limit)
+        now = time.monotonic()
+        with self._json_cache_lock:
+            cached = self._json_cache.get(key)
+            if cached is not None and now - cached[0] < self.JSON_CACHE_TTL:
+                return cached[1]
+
+        if source_type:
+            transcriptions = self.get_transcriptions_by_source(source_type, limit)
+        else:
+            transcriptions = self.get_recent_transcriptions(limit)
+
+        payload = {"transcriptions": transcriptions, "count": len(transcriptions), "status": "success"}
+        blob = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        with self._json_cache_lock:
+            if len(self._json_cache) >= self.MAX_CACHED_PAYLOADS:
+                self._json_cache.clear()
+            self._json_cache[key] = (now, blob)
+        return blob
+
+    def _invalidate_json_cache(self):
+        """Drop serialized payloads after the transcriptions table changed"""
+        with self._json_cache_lock:
+            self._json_cache.clear()
+            self.change_count += 1
+
     def search_transcriptions(self, query: str, limit: int = 50) -> List[Dict]:
         """Search transcriptions by text content"""
         if not self.database_enabled:
@@ -356,6 +397,7 @@ class ChatHistoryManager:
             with self.db_lock:
                 with sqlite3.connect(self.db_path) as conn:
                     cursor = conn.execute("UPDATE transcriptions SET text = ? WHERE id = ?", (text, transcription_id))
+                    self._invalidate_json_cache()
                     return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"Failed to update transcription {transcription_id}: {e}")
@@ -371,6 +413,7 @@ class ChatHistoryManager:
             with self.db_lock:
                 with sqlite3.connect(self.db_path) as conn:
                     cursor = conn.execute("DELETE FROM transcriptions WHERE id = ?", (transcription_id,))
+                    self._invalidate_json_cache()
                     return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"Failed to delete transcription {transcription_id}: {e}")
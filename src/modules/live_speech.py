@@ -4,26 +4,50 @@ Handles WebSocket connections and real-time speech recognition
 Preserves all original WebSocket features and enhances with real implementation
 """
 
+import base64
+import binascii
 import logging
 import os
 import tempfile
 from datetime import datetime
 
+import numpy as np
 from flask import request
 from flask_socketio import emit
 
+from .audio_kernels import WHISPER_SAMPLE_RATE, decode_pcm16_wav, high_pass, int16_to_float32, rms
+from .transcription_batcher import MAX_CLIP_SAMPLES
+
 logger = logging.getLogger(__name__)
 
+# Streamed recordings are capped at 10 minutes of 16-bit mono PCM
+MAX_RECORDING_BYTES = WHISPER_SAMPLE_RATE * 2 * 600
+
 
 class LiveSpeechHandler:
     """Manages WebSocket connections and live speech transcription"""
 
-    def __init__(self, model_manager, whisper_available, system_stats, connected_clients, chat_history):
+    def __init__(
+        self,
+        model_manager,
+        whisper_available,
+        system_stats,
+        connected_clients,
+        chat_history,
+        transcription_cache=None,
+        batcher=None,
+        silence_rms_threshold=None,
+    ):
         self.model_manager = model_manager
         self.whisper_available = whisper_available
         self.system_stats = system_stats
         self.connected_clients = connected_clients
         self.chat_history = chat_history
+        self.transcription_cache = transcription_cache
+        self.batcher = batcher
+        # Optional gate: chunks quieter than this RMS level skip Whisper (None keeps every chunk)
+        self.silence_rms_threshold = silence_rms_threshold
+        self._recordings = {}  # sid -> (language, PCM bytes) for clients streaming audio_frames
 
     def handle_connect(self):
         """Handle WebSocket connection - Original functionality preserved"""
@@ -43,6 +67,7 @@ class LiveSpeechHandler:
         """Handle WebSocket disconnection - Original functionality preserved"""
         if request.sid in self.connected_clients:
             self.connected_clients.remove(request.sid)
+        self._recordings.pop(request.sid, None)
         self.system_stats["active_connections"] = len(self.connected_clients)
         logger.info(f"Client disconnected: {request.sid}")
 
@@ -80,69 +105,149 @@ class LiveSpeechHandler:
                 emit("transcription_error", {"error": "No audio data received"})
                 return
 
-            # Save audio chunk temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
-                # Assuming audio_data is base64 encoded or binary
-                if isinstance(audio_data, str):
-                    import base64
+            audio_bytes = self._decode_audio_data(audio_data)
+            if audio_bytes is None:
+                emit("transcription_error", {"error": "Audio data must be binary or base64 encoded"})
+                return
 
-                    audio_bytes = base64.b64decode(audio_data)
-                else:
-                    audio_bytes = audio_data
+            # 16 kHz PCM WAV chunks are decoded in-process, anything else goes through ffmpeg from a temp file
+            samples = decode_pcm16_wav(audio_bytes)
+            if samples is not None:
+                self._transcribe_and_emit(audio_bytes, samples, language)
+                return
 
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
                 tmp_file.write(audio_bytes)
-                tmp_file.flush()
+            try:
+                self._transcribe_and_emit(audio_bytes, tmp_file.name, language)
+            finally:
+                os.unlink(tmp_file.name)
 
-                # Transcribe in real-time using model manager
-                logger.info(f"Processing live audio chunk with language: {language}")
-                model = self.model_manager.get_model()
-                if model is None:
-                    emit("transcription_error", {"error": "No model loaded"})
-                    return
+        except Exception as e:
+            logger.error(f"Live transcription error: {e}")
+            emit("transcription_error", {"error": str(e), "timestamp": datetime.now().isoformat()})
 
-                # Use language parameter if specified
-                transcribe_options = {"fp16": False}
-                if language and language != "auto":
-                    transcribe_options["language"] = language
+    @staticmethod
+    def _decode_audio_data(audio_data):
+        """Raw bytes of an audio_chunk payload, or None when it is neither binary nor valid base64"""
+        # Current clients send a binary Socket.IO attachment; base64 strings from older pages are still decoded
+        if isinstance(audio_data, (bytes, bytearray)):
+            return bytes(audio_data)
+        if isinstance(audio_data, str):
+            try:
+                return base64.b64decode(audio_data, validate=True)
+            except binascii.Error:
+                return None
+        return None
 
-                result = model.transcribe(tmp_file.name, **transcribe_options)
+    def handle_audio_frames(self, data):
+        """Append streamed 16 kHz mono int16 PCM frames to the client's open recording"""
+        recording = self._recordings.get(request.sid)
+        if recording is None or not isinstance(data, (bytes, bytearray)):
+            return
 
-                # Clean up
-                os.unlink(tmp_file.name)
+        pcm = recording[1]
+        if len(pcm) >= MAX_RECORDING_BYTES:
+            return
+        pcm.extend(data[: MAX_RECORDING_BYTES - len(pcm)])
 
-                # Send result back via WebSocket AND save to history
-                transcription_data = {
-                    "text": result["text"],
-                    "language": result.get("language", "unknown"),
-                    "timestamp": datetime.now().isoformat(),
-                    "confidence": getattr(result, "confidence", 0.0),
-                }
-
-                # Save to chat history
-                try:
-                    self.chat_history.add_transcription(
-                        text=result["text"],
-                        language=result.get("language", "unknown"),
-                        model_used=self.model_manager.get_current_model_name(),
-                        source_type="live",
-                        metadata={"timestamp": datetime.now().isoformat()},
-                    )
-                    logger.info(f"✅ Saved live speech to history: {result['text'][:50]}...")
-                except Exception as e:
-                    logger.warning(f"Failed to save live speech to history: {e}")
-
-                emit("transcription_result", transcription_data)
-
-                # Update stats
-                self.system_stats["total_transcriptions"] += 1
+        # Tell the client once that the rest of the recording is being dropped
+        if len(pcm) >= MAX_RECORDING_BYTES:
+            logger.warning(f"Recording limit reached for client: {request.sid}")
+            emit(
+                "transcription_error",
+                {"error": "Recording limit reached - later audio is not transcribed", "timestamp": datetime.now().isoformat()},
+            )
+
+    def _transcribe_recording(self, language, pcm):
+        """Transcribe the PCM frames collected between start_recording and stop_recording"""
+        if not self.whisper_available:
+            emit("transcription_error", {"error": "Whisper model not available"})
+            return
 
+        try:
+            audio_bytes = bytes(pcm[: len(pcm) - len(pcm) % 2])
+            samples = int16_to_float32(np.frombuffer(audio_bytes, dtype="<i2"))
+            self._transcribe_and_emit(audio_bytes, samples, language)
         except Exception as e:
             logger.error(f"Live transcription error: {e}")
             emit("transcription_error", {"error": str(e), "timestamp": datetime.now().isoformat()})
 
+    def _is_silent(self, samples):
+        """Whether samples fall below the configured silence gate"""
+        return self.silence_rms_threshold is not None and rms(samples) < self.silence_rms_threshold
+
+    def _run_model(self, model, audio_input, transcribe_options):
+        """Transcribe one chunk, batching short in-memory clips when a batcher is configured"""
+        # Short in-memory chunks share batched decodes; long recordings and files would hold up the queue
+        if self.batcher is not None and not isinstance(audio_input, str) and len(audio_input) <= MAX_CLIP_SAMPLES:
+            return self.batcher.submit(audio_input, **transcribe_options).result(timeout=self.batcher.result_timeout)
+        return model.transcribe(audio_input, **transcribe_options)
+
+    def _transcribe_and_emit(self, audio_bytes, audio_input, language):
+        """Transcribe decoded samples or an audio file path, send the result and save it to history"""
+        # Transcribe in real-time using model manager
+        logger.info(f"Processing live audio chunk with language: {language}")
+        model = self.model_manager.get_model()
+        if model is None:
+            emit("transcription_error", {"error": "No model loaded"})
+            return
+
+        # Use language parameter if specified
+        transcribe_options = {"fp16": False}
+        if language and language != "auto":
+            transcribe_options["language"] = language
+
+        if not isinstance(audio_input, str):
+            # Browser microphones often carry DC offset and handling rumble Whisper does not need
+            audio_input = high_pass(audio_input)
+            if self._is_silent(audio_input):
+                emit("transcription_result", {"text": "", "language": language, "silence": True})
+                return
+
+        # Identical chunks (e.g. repeated voice commands) reuse the cached result
+        model_name = self.model_manager.get_current_model_name()
+        cache_key = None
+        result = None
+        if self.transcription_cache is not None:
+            cache_key = self.transcription_cache.make_key(audio_bytes, model_name, **transcribe_options)
+            result = self.transcription_cache.get(cache_key)
+
+        if result is None:
+            result = self._run_model(model, audio_input, transcribe_options)
+            if cache_key is not None:
+                self.transcription_cache.set(cache_key, result)
+
+        # Send result back via WebSocket AND save to history
+        transcription_data = {
+            "text": result["text"],
+            "language": result.get("language", "unknown"),
+            "timestamp": datetime.now().isoformat(),
+            "confidence": getattr(result, "confidence", 0.0),
+        }
+
+        # Save to chat history
+        try:
+            self.chat_history.add_transcription(
+                text=result["text"],
+                language=result.get("language", "unknown"),
+                model_used=model_name,
+                source_type="live",
+                metadata={"timestamp": datetime.now().isoformat()},
+            )
+            logger.info(f"✅ Saved live speech to history: {result['text'][:50]}...")
+        except Exception as e:
+            logger.warning(f"Failed to save live speech to history: {e}")
+
+        emit("transcription_result", transcription_data)
+
+        # Update stats
+        self.system_stats.increment("total_transcriptions")
+
     def handle_start_recording(self, data):
         """Start live recording session - NEW FEATURE"""
         logger.info(f"Starting live recording session for client: {request.sid}")
+        self._recordings[request.sid] = ((data or {}).get("language", "auto"), bytearray())
         emit(
             "recording_started",
             {"status": "recording", "message": "Live recording started", "timestamp": datetime.now().isoformat()},
@@ -155,3 +260,8 @@ class LiveSpeechHandler:
             "recording_stopped",
             {"status": "stopped", "message": "Live recording stopped", "timestamp": datetime.now().isoformat()},
         )
+
+        # Clients streaming PCM frames get the whole recording transcribed now
+        recording = self._recordings.pop(request.sid, None)
+        if recording is not None and recording[1]:
+            self._transcribe_recording(*recording)
@@ -14,6 +14,76 @@ from typing import Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 
+class FasterWhisperModel:
+    """Wraps a faster-whisper (CTranslate2) model behind the openai-whisper transcribe() interface"""
+
+    # faster-whisper names the newest large checkpoint explicitly
+    MODEL_NAMES = {"large": "large-v3"}
+
+    # openai-whisper transcribe() options faster-whisper understands under the same name
+    PASSTHROUGH_OPTIONS = frozenset(
+        {
+            "task",
+            "temperature",
+            "beam_size",
+            "best_of",
+            "patience",
+            "length_penalty",
+            "compression_ratio_threshold",
+            "no_speech_threshold",
+            "condition_on_previous_text",
+            "initial_prompt",
+            "prefix",
+            "suppress_blank",
+            "suppress_tokens",
+            "without_timestamps",
+            "max_initial_timestamp",
+            "word_timestamps",
+            "prepend_punctuations",
+            "append_punctuations",
+        }
+    )
+    # Same option, different name in faster-whisper
+    RENAMED_OPTIONS = {"logprob_threshold": "log_prob_threshold"}
+    # Options that only steer openai-whisper's PyTorch runtime
+    IGNORED_OPTIONS = frozenset({"fp16", "verbose"})
+
+    def __init__(self, model_name: str, compute_type: str, download_root: Optional[str] = None):
+        from faster_whisper import WhisperModel
+
+        self.compute_type = compute_type
+        self.model = WhisperModel(
+            self.MODEL_NAMES.get(model_name, model_name), compute_type=compute_type, download_root=download_root
+        )
+
+    @classmethod
+    def convert_options(cls, options: Dict) -> Dict:
+        """Map openai-whisper transcribe() options to faster-whisper, rejecting ones it cannot honour"""
+        converted = {}
+        unsupported = []
+        for name, value in options.items():
+            if name in cls.IGNORED_OPTIONS:
+                continue
+            if name == "suppress_tokens" and isinstance(value, str):
+                # openai-whisper accepts a comma separated string such as "-1"
+                value = [int(token) for token in value.split(",") if token.strip()]
+            if name in cls.PASSTHROUGH_OPTIONS:
+                converted[name] = value
+            elif name in cls.RENAMED_OPTIONS:
+                converted[cls.RENAMED_OPTIONS[name]] = value
+            else:
+                unsupported.append(name)
+        if unsupported:
+            raise TypeError(f"faster-whisper does not support transcribe option(s): {', '.join(sorted(unsupported))}")
+        return converted
+
+    def transcribe(self, audio, language: Optional[str] = None, **kwargs) -> Dict:
+        """Transcribe audio and return an openai-whisper style result dict"""
+        segments, info = self.model.transcribe(audio, language=language, **self.convert_options(kwargs))
+        segments = [{"start": s.start, "end": s.end, "text": s.text} for s in segments]
+        return {"text": "".join(s["text"] for s in segments), "language": info.language, "segments": segments}
+
+
 class ModelManager:
     """Manages Whisper model loading and switching"""
 
@@ -84,7 +154,10 @@ class ModelManager:
         # }
     }
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, torch_compile: bool = False, quantization: Optional[str] = None):
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser("~"), ".cache", "whisper")
+        self.torch_compile = torch_compile
+        self.quantization = quantization  # e.g. "int8", served by faster-whisper when installed
         self.current_model = None
         self.current_model_name = "base"  # Default model
         self.model_loading = False
@@ -116,13 +189,14 @@ class ModelManager:
         import os
 
         try:
-            # Whisper stores models in ~/.cache/whisper/
-            whisper_cache = os.path.expanduser("~/.cache/whisper/")
+            # Whisper stores models in ~/.cache/whisper/ unless a cache_dir is configured
+            whisper_cache = self._get_model_cache_dir()
             if os.path.exists(whisper_cache):
+                cached_files = os.listdir(whisper_cache)
                 for model_name in self.AVAILABLE_MODELS.keys():
                     # Check for .pt files that match model names
-                    model_files = [f for f in os.listdir(whisper_cache) if f.startswith(model_name) and f.endswith(".pt")]
-                    if model_files:
+                    model_files = [f for f in cached_files if f.startswith(model_name) and f.endswith(".pt")]
+                    if model_files or (self.quantization and self._has_faster_whisper_model(whisper_cache, model_name)):
                         self.downloaded_models.add(model_name)
                         logger.info(f"📦 Found downloaded model: {model_name}")
 
@@ -130,6 +204,19 @@ class ModelManager:
         except Exception as e:
             logger.warning(f"Could not check downloaded models: {e}")
 
+    @staticmethod
+    def _has_faster_whisper_model(cache_dir: str, model_name: str) -> bool:
+        """Whether faster-whisper has a converted CTranslate2 model for model_name in cache_dir
+
+        faster-whisper downloads through the Hugging Face hub cache layout:
+        models--Systran--faster-whisper-<name>/snapshots/<revision>/model.bin
+        """
+        repo_name = FasterWhisperModel.MODEL_NAMES.get(model_name, model_name)
+        snapshots = os.path.join(cache_dir, f"models--Systran--faster-whisper-{repo_name}", "snapshots")
+        if not os.path.isdir(snapshots):
+            return False
+        return any(os.path.exists(os.path.join(snapshots, revision, "model.bin")) for revision in os.listdir(snapshots))
+
     def load_model(self, model_name: str = "base") -> bool:
         """Load a Whisper model"""
         if not self.whisper_available:
@@ -149,8 +236,14 @@ class ModelManager:
                 self.model_loading = True
                 logger.info(f"Loading Whisper model: {model_name}")
 
-                # Load the model
-                self.current_model = self.whisper.load_model(model_name)
+                # Load the model - quantized through faster-whisper if requested and installed
+                model = self._load_quantized_model(model_name) if self.quantization else None
+                if model is None:
+                    model = self.whisper.load_model(model_name, download_root=self.cache_dir)
+                    if self.torch_compile:
+                        self._compile_model(model)
+
+                self.current_model = model
                 self.current_model_name = model_name
 
                 logger.info(f"Successfully loaded model: {model_name}")
@@ -162,6 +255,34 @@ class ModelManager:
             finally:
                 self.model_loading = False
 
+    def _load_quantized_model(self, model_name: str):
+        """Load a quantized faster-whisper model, or None to fall back to openai-whisper"""
+        try:
+            model = FasterWhisperModel(model_name, self.quantization, download_root=self.cache_dir)
+            self.downloaded_models.add(model_name)
+            logger.info(f"✅ Loaded {model_name} via faster-whisper ({self.quantization})")
+            return model
+        except ImportError:
+            logger.info(f"faster-whisper not installed - loading {model_name} without {self.quantization} quantization")
+        except Exception as e:
+            logger.warning(f"Quantized load of {model_name} failed, falling back to openai-whisper: {e}")
+        return None
+
+    def _compile_model(self, model):
+        """Compile the audio encoder with torch.compile and warm it up before serving"""
+        eager_encoder = model.encoder
+        try:
+            import numpy as np
+            import torch
+
+            # The encoder always sees 30 s mel windows, so a single warm-up compiles it for every request
+            model.encoder = torch.compile(eager_encoder)
+            model.transcribe(np.zeros(16000, dtype=np.float32))
+            logger.info("✅ Whisper encoder compiled with torch.compile")
+        except Exception as e:
+            model.encoder = eager_encoder
+            logger.warning(f"torch.compile not usable, keeping eager encoder: {e}")
+
     def get_current_model(self):
         """Get the currently loaded model"""
         return self.current_model
@@ -208,6 +329,7 @@ class ModelManager:
             "current_model_name": self.get_current_model_name(), # Changed from current_model to current_model_name for clarity
             "model_loaded": self.current_model is not None,
             "model_loading": self.model_loading,
+            "quantization": getattr(self.current_model, "compute_type", None),
             "available_models_info": self.get_available_models(), # Provides full details
             "downloaded_model_ids": list(self.downloaded_models), # List of IDs
         }
@@ -229,7 +351,7 @@ class ModelManager:
 
     def _get_model_cache_dir(self):
         """Gets the Whisper model cache directory."""
-        return os.path.join(os.path.expanduser("~"), ".cache", "whisper")
+        return self.cache_dir
 
     def _perform_download(self, model_id: str):
         """Performs the actual download of a model file."""
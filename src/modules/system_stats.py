@@ -0,0 +1,21 @@
+"""
+System Statistics Module
+Shared runtime statistics with thread-safe counter updates
+"""
+
+import threading
+
+
+class SystemStats(dict):
+    """System statistics dict whose counters can be incremented atomically"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def increment(self, key: str, amount: int = 1) -> int:
+        """Atomically add amount to a counter and return the new value"""
+        with self._lock:
+            value = self.get(key, 0) + amount
+            self[key] = value
+            return value
@@ -0,0 +1,166 @@
+"""
+Transcription Batcher Module
+Coalesces concurrent live speech chunks into batched Whisper decodes
+Short clips (<= 30 s) with identical options share one encoder/decoder pass;
+uploads and long recordings go straight to ModelManager.transcribe
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Only clips that fit in one Whisper window (30 s of 16 kHz audio) are queued for batching
+MAX_CLIP_SAMPLES = 30 * 16000
+
+# Options whisper.decode() understands - anything else needs the full transcribe() pipeline
+BATCHABLE_OPTIONS = frozenset({"language", "fp16"})
+
+# Longest a caller waits for its result before giving up on a stuck worker - only <= 30 s clips are queued
+RESULT_TIMEOUT_SECONDS = 60
+
+# transcribe() defaults for deciding a greedy decode needs its temperature fallback
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+
+
+class TranscriptionBatcher:
+    """Queues transcription requests and runs them in small batches on one worker thread"""
+
+    def __init__(
+        self, model_manager, max_batch: int = 8, max_wait_ms: int = 10, result_timeout: float = RESULT_TIMEOUT_SECONDS
+    ):
+        self.model_manager = model_manager
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.result_timeout = result_timeout
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="transcription-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, audio, **options) -> Future:
+        """Queue audio (file path or 16 kHz float32 samples) and return a Future for the result"""
+        future = Future()
+        self._queue.put((self._prepare_audio(audio), options, future))
+        return future
+
+    def transcribe(self, audio, **options) -> Optional[Dict]:
+        """Submit audio and wait for the result - None on failure, like ModelManager.transcribe"""
+        try:
+            return self.submit(audio, **options).result(timeout=self.result_timeout)
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            return None
+
+    def _get_batchable_model(self):
+        """Current model if it is an openai-whisper model that whisper.decode() can batch"""
+        model = self.model_manager.get_model()
+        return model if hasattr(model, "dims") else None
+
+    def _prepare_audio(self, audio):
+        """Decode audio files in the caller's thread so ffmpeg runs outside the worker"""
+        if isinstance(audio, str) and self._get_batchable_model() is not None:
+            return self.model_manager.whisper.load_audio(audio)
+        return audio
+
+    def _run(self):
+        """Worker loop: collect up to max_batch requests within max_wait, then process them"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._process(batch)
+            except Exception as e:
+                # Never leave a caller waiting on a future the worker will not resolve
+                logger.error(f"Transcription batch failed: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _process(self, batch):
+        """Decode batchable requests together and transcribe the rest one by one"""
+        model = self._get_batchable_model()
+        groups = {}
+        for request in batch:
+            audio, options, _ = request
+            if (
+                model is not None
+                and hasattr(audio, "shape")
+                and audio.shape[0] <= self.model_manager.whisper.audio.N_SAMPLES
+                and BATCHABLE_OPTIONS.issuperset(options)
+            ):
+                groups.setdefault((options.get("language"), options.get("fp16", True)), []).append(request)
+            else:
+                self._transcribe_single(request)
+
+        for requests in groups.values():
+            if len(requests) == 1:
+                self._transcribe_single(requests[0])
+            else:
+                self._decode_batch(model, requests)
+
+    def _transcribe_single(self, request):
+        """Run the regular ModelManager.transcribe() pipeline for one request"""
+        audio, options, future = request
+        try:
+            result = self.model_manager.transcribe(audio, **options)
+            if result is None:
+                raise RuntimeError("Transcription failed")
+            future.set_result(result)
+        except Exception as e:
+            future.set_exception(e)
+
+    def _decode_batch(self, model, requests):
+        """Run one batched greedy whisper.decode() over several short clips
+
+        This matches transcribe() for a single 30 s window: clips whose greedy decode would trigger
+        transcribe()'s temperature fallback are re-run through the full pipeline, and clips it would
+        treat as silence come back empty. Batched results carry no "segments".
+        """
+        whisper = self.model_manager.whisper
+        try:
+            import torch
+
+            mel = torch.stack(
+                [whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), n_mels=model.dims.n_mels) for audio, _, _ in requests]
+            ).to(model.device)
+            options = requests[0][1]
+            decode_options = whisper.DecodingOptions(
+                language=options.get("language"), fp16=options.get("fp16", True) and model.device.type != "cpu"
+            )
+            results = whisper.decode(model, mel, decode_options)
+        except Exception as e:
+            logger.warning(f"Batched decode failed, transcribing individually: {e}")
+            for request in requests:
+                self._transcribe_single(request)
+            return
+
+        logger.info(f"Decoded batch of {len(requests)} transcriptions")
+        self._resolve_decoded(requests, results)
+
+    def _resolve_decoded(self, requests, results):
+        """Hand out batched decode results, applying transcribe()'s silence and fallback rules"""
+        for request, result in zip(requests, results):
+            silent = result.no_speech_prob > NO_SPEECH_THRESHOLD
+            if silent and result.avg_logprob < LOGPROB_THRESHOLD:
+                request[2].set_result({"text": "", "language": result.language})
+            elif not silent and (
+                result.compression_ratio > COMPRESSION_RATIO_THRESHOLD or result.avg_logprob < LOGPROB_THRESHOLD
+            ):
+                self._transcribe_single(request)
+            else:
+                request[2].set_result({"text": result.text, "language": result.language})
@@ -0,0 +1,75 @@
+"""
+Transcription Cache Module
+Memoizes transcription results keyed by audio content hash
+Repeated clips (voice commands, demo uploads) skip Whisper inference entirely
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionCache:
+    """Thread-safe LRU cache of transcription results"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(audio_bytes: bytes, model_name: str, **options) -> str:
+        """Build a cache key from audio content, model and transcription options"""
+        hasher = hashlib.blake2b(audio_bytes, digest_size=16)
+        hasher.update(f"|{model_name}|{sorted(options.items())}".encode("utf-8"))
+        return hasher.hexdigest()
+
+    @classmethod
+    def make_file_key(cls, audio_path: str, model_name: str, **options) -> str:
+        """Build a cache key for an audio file on disk"""
+        with open(audio_path, "rb") as f:
+            return cls.make_key(f.read(), model_name, **options)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached result for key, or None on a miss"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(result)
+
+    def set(self, key: str, result: Dict):
+        """Store the user-visible fields of a transcription result"""
+        entry = {"text": result["text"], "language": result.get("language", "unknown")}
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Get cache size and hit-rate statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
@@ -3,7 +3,30 @@ Update System Module
 Git-based update management for Whisper Appliance
 """
 
-from .api import create_update_endpoints
-from .manager import UpdateManager
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api import create_update_endpoints  # noqa: F401
+    from .manager import UpdateManager  # noqa: F401
+
+# Symbols load from their defining submodule on first access, so UpdateManager
+# does not pull in the Flask endpoint code from .api
+_LAZY = {
+    "UpdateManager": (".manager", "UpdateManager"),
+    "create_update_endpoints": (".api", "create_update_endpoints"),
+}
+
+
+def __getattr__(name):
+    """Import exported names on first access and cache them in the module"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = _LAZY[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["UpdateManager", "create_update_endpoints"]
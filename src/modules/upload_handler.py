@@ -18,11 +18,32 @@ logger = logging.getLogger(__name__)
 class UploadHandler:
     """Handles audio file upload and transcription"""
 
-    def __init__(self, model_manager, whisper_available, system_stats, chat_history):
+    def __init__(self, model_manager, whisper_available, system_stats, chat_history, transcription_cache=None):
         self.model_manager = model_manager
         self.whisper_available = whisper_available
         self.system_stats = system_stats
         self.chat_history = chat_history
+        self.transcription_cache = transcription_cache
+
+    def _transcribe(self, audio_path, **kwargs):
+        """Transcribe audio file - uploads can be long, so they skip the live speech batcher"""
+        return self.model_manager.transcribe(audio_path, **kwargs)
+
+    def _transcribe_cached(self, audio_path, model_name, **kwargs):
+        """Transcribe audio file, reusing a cached result for identical audio"""
+        if self.transcription_cache is None:
+            return self._transcribe(audio_path, **kwargs), "MISS"
+
+        cache_key = self.transcription_cache.make_file_key(audio_path, model_name, **kwargs)
+        result = self.transcription_cache.get(cache_key)
+        if result is not None:
+            logger.info(f"Transcription cache hit with model: {model_name}")
+            return result, "HIT"
+
+        result = self._transcribe(audio_path, **kwargs)
+        if result:
+            self.transcription_cache.set(cache_key, result)
+        return result, "MISS"
 
     def transcribe_upload(self):
         """Transcribe uploaded audio file - Original functionality preserved"""
@@ -47,13 +68,13 @@ class UploadHandler:
                 # Transcribe audio using ModelManager
                 current_model = self.model_manager.get_current_model_name()
                 logger.info(f"Transcribing file: {filename} with model: {current_model}")
-                result = self.model_manager.transcribe(tmp_file.name)
+                result, cache_status = self._transcribe_cached(tmp_file.name, current_model)
 
                 # Clean up temp file
                 os.unlink(tmp_file.name)
 
                 # Update statistics
-                self.system_stats["total_transcriptions"] += 1
+                self.system_stats.increment("total_transcriptions")
                 logger.info("Transcription completed successfully")
 
                 if result:
@@ -70,7 +91,7 @@ class UploadHandler:
                     except Exception as e:
                         logger.warning(f"Failed to save transcription to history: {e}")
 
-                    return jsonify(
+                    response = jsonify(
                         {
                             "text": result["text"],
                             "language": result.get("language", "unknown"),
@@ -78,6 +99,8 @@ class UploadHandler:
                             "timestamp": datetime.now().isoformat(),
                         }
                     )
+                    response.headers["X-Cache"] = cache_status
+                    return response
                 else:
                     return jsonify({"error": "Transcription failed"})
 
@@ -106,30 +129,33 @@ class UploadHandler:
                 if language != "auto":
                     kwargs["language"] = language
 
-                result = self.model_manager.transcribe(tmp_file.name, **kwargs)
+                current_model = self.model_manager.get_current_model_name()
+                result, cache_status = self._transcribe_cached(tmp_file.name, current_model, **kwargs)
                 os.unlink(tmp_file.name)
 
-                self.system_stats["total_transcriptions"] += 1
+                self.system_stats.increment("total_transcriptions")
 
                 # Save to chat history
                 try:
                     self.chat_history.add_transcription(
                         text=result["text"],
                         language=result.get("language", "unknown"),
-                        model_used=self.model_manager.get_current_model_name(),
+                        model_used=current_model,
                         source_type="live_api",
                         metadata={"language_requested": language, "timestamp": datetime.now().isoformat()},
                     )
                 except Exception as e:
                     logger.warning(f"Failed to save live transcription to history: {e}")
 
-                return jsonify(
+                response = jsonify(
                     {
                         "text": result["text"],
                         "language": result.get("language", "unknown"),
                         "timestamp": datetime.now().isoformat(),
                     }
                 )
+                response.headers["X-Cache"] = cache_status
+                return response
 
         except Exception as e:
             logger.error(f"Live transcription error: {e}")
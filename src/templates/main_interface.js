@@ -0,0 +1,674 @@
+// Elements touched by the live speech, socket and upload paths are looked up once
+const liveResult = document.getElementById('liveResult');
+const wsStatus = document.getElementById('ws-status');
+const wsIndicator = document.getElementById('ws-indicator');
+const startBtn = document.getElementById('startBtn');
+const stopBtn = document.getElementById('stopBtn');
+const recordingIndicator = document.getElementById('recordingIndicator');
+const deviceSelect = document.getElementById('deviceSelect');
+const languageSelect = document.getElementById('languageSelect');
+const uploadResult = document.getElementById('uploadResult');
+const uploadBtn = document.getElementById('uploadBtn');
+
+// Tab switching functionality
+// History functions
+async function loadHistory() {
+    try {
+        const historyList = document.getElementById('historyList');
+        historyList.innerHTML = '<p style="text-align: center;">Loading...</p>';
+
+        const response = await fetch('/api/chat-history?limit=50');
+        const data = await response.json();
+
+        if (data.status === 'success' && data.transcriptions.length > 0) {
+            let html = '';
+            data.transcriptions.forEach(item => {
+                const date = new Date(item.timestamp).toLocaleString();
+                html += `
+                    <div style="border: 1px solid rgba(255,255,255,0.2); border-radius: 8px; padding: 15px; margin: 10px 0; background: rgba(255,255,255,0.05);" data-id="${item.id}">
+                        <div style="font-size: 0.9em; color: #ccc; margin-bottom: 8px;">
+                            📅 ${date} | 🎯 ${item.source_type || 'unknown'} | 🧠 ${item.model_used || 'unknown'}
+                        </div>
+                        <div class="transcription-text" style="line-height: 1.5; word-wrap: break-word;">${item.text || 'No text'}</div>
+                        <div class="transcription-actions" style="margin-top: 10px;">
+                            <button onclick="editTranscription(${item.id})" style="background: #007bff; color: white; border: none; padding: 4px 8px; border-radius: 4px; font-size: 0.8em; cursor: pointer; margin-right: 5px;">✏️ Edit</button>
+                            <button onclick="deleteTranscription(${item.id})" style="background: #ff4444; color: white; border: none; padding: 4px 8px; border-radius: 4px; font-size: 0.8em; cursor: pointer;">🗑️ Delete</button>
+                        </div>
+                    </div>
+                `;
+            });
+            historyList.innerHTML = html;
+        } else {
+            historyList.innerHTML = '<p style="text-align: center; color: #ccc;">No transcriptions found</p>';
+        }
+    } catch (error) {
+        console.error('Failed to load history:', error);
+        document.getElementById('historyList').innerHTML = '<p style="text-align: center; color: #ff6b6b;">Error loading history</p>';
+    }
+}
+
+let currentEditingId = null;
+
+function editTranscription(id) {
+    if (currentEditingId && currentEditingId !== id) {
+        cancelEdit(currentEditingId);
+    }
+
+    currentEditingId = id;
+    const item = document.querySelector(`[data-id="${id}"]`);
+    if (!item) return;
+
+    const textDiv = item.querySelector('.transcription-text');
+    const actionsDiv = item.querySelector('.transcription-actions');
+    const originalText = textDiv.textContent;
+
+    // Replace text with textarea
+    textDiv.innerHTML = `<textarea style="width: 100%; min-height: 60px; background: rgba(255,255,255,0.2); border: 1px solid rgba(255,255,255,0.3); border-radius: 4px; padding: 8px; color: white; font-family: inherit; resize: vertical;" id="edit-text-${id}">${originalText}</textarea>`;
+
+    // Replace actions with save/cancel buttons
+    actionsDiv.innerHTML = `
+        <button onclick="saveEdit(${id})" style="background: #28a745; color: white; border: none; padding: 4px 8px; border-radius: 4px; font-size: 0.8em; cursor: pointer; margin-right: 5px;">💾 Save</button>
+        <button onclick="cancelEdit(${id})" style="background: #6c757d; color: white; border: none; padding: 4px 8px; border-radius: 4px; font-size: 0.8em; cursor: pointer;">❌ Cancel</button>
+    `;
+
+    // Focus the textarea
+    document.getElementById(`edit-text-${id}`).focus();
+}
+
+async function saveEdit(id) {
+    const textarea = document.getElementById(`edit-text-${id}`);
+    const newText = textarea.value.trim();
+
+    if (!newText) {
+        alert('Text cannot be empty');
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/chat-history/update/${id}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ text: newText })
+        });
+
+        const data = await response.json();
+        if (data.status === 'success') {
+            currentEditingId = null;
+            loadHistory(); // Reload to show updated text
+            alert('✅ Transcription updated successfully');
+        } else {
+            alert('❌ Failed to update transcription');
+        }
+    } catch (error) {
+        console.error('Edit failed:', error);
+        alert('❌ Edit error');
+    }
+}
+
+function cancelEdit(id) {
+    currentEditingId = null;
+    loadHistory(); // Reload to restore original view
+}
+
+async function deleteTranscription(id) {
+    if (!confirm('Delete this transcription?')) return;
+
+    try {
+        const response = await fetch(`/api/chat-history/delete/${id}`, { method: 'DELETE' });
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            loadHistory();
+            showMessage('✅ Deleted successfully');
+        } else {
+            showMessage('❌ Delete failed');
+        }
+    } catch (error) {
+        console.error('Delete failed:', error);
+        showMessage('❌ Delete error');
+    }
+}
+
+async function exportHistory(format) {
+    try {
+        const response = await fetch(`/api/chat-history/export?format=${format}`);
+
+        if (format === 'csv') {
+            const blob = await response.blob();
+            const url = window.URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = `chat_history_${new Date().toISOString().split('T')[0]}.csv`;
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            window.URL.revokeObjectURL(url);
+        } else {
+            const data = await response.json();
+            const blob = new Blob([data.data], { type: 'application/json' });
+            const url = window.URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = `chat_history_${new Date().toISOString().split('T')[0]}.json`;
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            window.URL.revokeObjectURL(url);
+        }
+
+        alert('✅ Export successful');
+    } catch (error) {
+        console.error('Export failed:', error);
+        alert('❌ Export failed');
+    }
+}
+
+function showMessage(message) {
+    alert(message);
+}
+
+function showTab(tabName) {
+    // Load history when history tab is opened
+    if (tabName === 'history') {
+        loadHistory();
+    }
+    // Hide all tabs
+    const tabs = document.querySelectorAll('.tab-content');
+    tabs.forEach(tab => tab.classList.remove('active'));
+
+    // Remove active class from all buttons
+    const buttons = document.querySelectorAll('.tab-button');
+    buttons.forEach(btn => btn.classList.remove('active'));
+
+    // Show selected tab
+    document.getElementById(tabName).classList.add('active');
+    event.target.classList.add('active');
+}
+
+// Model Management Functions
+async function loadModels() {
+    try {
+        const response = await fetch('/api/models');
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            updateModelStatus(data.current_model, data.model_loading);
+            console.log('Available models:', data.available_models);
+        }
+    } catch (error) {
+        console.error('Failed to load models:', error);
+    }
+}
+
+async function switchModel(modelName) {
+    try {
+        const modelStatus = document.getElementById('model-status');
+        modelStatus.textContent = `Loading ${modelName} model...`;
+        modelStatus.style.color = '#007bff';
+
+        const response = await fetch(`/api/models/${modelName}`, {
+            method: 'POST'
+        });
+        const data = await response.json();
+
+        if (data.status === 'loading') {
+            modelStatus.textContent = `Loading ${modelName} model... Please wait.`;
+
+            // Poll for completion
+            const pollInterval = setInterval(async () => {
+                try {
+                    const statusResponse = await fetch('/api/models');
+                    const statusData = await statusResponse.json();
+
+                    if (!statusData.model_loading) {
+                        clearInterval(pollInterval);
+                        if (statusData.current_model === modelName) {
+                            modelStatus.textContent = `✅ Using ${modelName} model`;
+                            modelStatus.style.color = '#28a745';
+                        } else {
+                            modelStatus.textContent = `❌ Failed to load ${modelName} model`;
+                            modelStatus.style.color = '#dc3545';
+                        }
+                    }
+                } catch (error) {
+                    clearInterval(pollInterval);
+                    modelStatus.textContent = `❌ Error checking model status`;
+                    modelStatus.style.color = '#dc3545';
+                }
+            }, 2000);
+        } else {
+            modelStatus.textContent = `❌ ${data.error || 'Failed to load model'}`;
+            modelStatus.style.color = '#dc3545';
+        }
+    } catch (error) {
+        console.error('Failed to switch model:', error);
+        document.getElementById('model-status').textContent = `❌ Network error`;
+        document.getElementById('model-status').style.color = '#dc3545';
+    }
+}
+
+function updateModelStatus(currentModel, isLoading) {
+    const modelSelect = document.getElementById('modelSelect');
+    const modelStatus = document.getElementById('model-status');
+
+    if (modelSelect) {
+        modelSelect.value = currentModel;
+    }
+
+    if (isLoading) {
+        modelStatus.textContent = `Loading ${currentModel} model...`;
+        modelStatus.style.color = '#007bff';
+    } else {
+        modelStatus.textContent = `✅ Using ${currentModel} model`;
+        modelStatus.style.color = '#28a745';
+    }
+}
+
+// WebSocket and audio functionality
+let socket = null;
+let audioContext = null;
+let micStream = null;
+let micSource = null;
+let captureNode = null;
+let isRecording = false;
+
+// Live result nodes are created once and filled via textContent, so server text is never parsed as HTML
+const liveResultTime = document.createElement('strong');
+const liveResultText = document.createElement('div');
+const liveResultLanguage = document.createElement('small');
+const liveResultError = document.createElement('span');
+liveResultError.style.color = '#ff6b6b';
+
+// AudioWorklet that turns microphone input into 16 kHz mono int16 PCM and posts 20 ms (320 sample) frames
+// Each output sample averages the input samples it covers (a boxcar low-pass), so
+// speech above 8 kHz is attenuated instead of aliasing into the 16 kHz stream
+const PCM_WORKLET_SOURCE = `
+    class PcmCaptureProcessor extends AudioWorkletProcessor {
+        constructor() {
+            super();
+            this.step = sampleRate / 16000;
+            this.boundary = this.step;
+            this.sum = 0;
+            this.count = 0;
+            this.frame = new Int16Array(320);
+            this.length = 0;
+        }
+        process(inputs) {
+            const input = inputs[0][0];
+            if (!input) return true;
+            for (let i = 0; i < input.length; i++) {
+                this.sum += input[i];
+                this.count++;
+                if (i + 1 < this.boundary) continue;
+                const sample = Math.max(-1, Math.min(1, this.sum / this.count));
+                this.frame[this.length++] = sample < 0 ? sample * 0x8000 : sample * 0x7fff;
+                this.sum = 0;
+                this.count = 0;
+                this.boundary += this.step;
+                if (this.length === this.frame.length) {
+                    this.port.postMessage(this.frame.buffer, [this.frame.buffer]);
+                    this.frame = new Int16Array(320);
+                    this.length = 0;
+                }
+            }
+            this.boundary -= input.length;
+            return true;
+        }
+    }
+    registerProcessor('pcm-capture', PcmCaptureProcessor);
+`;
+const pcmWorkletUrl = URL.createObjectURL(new Blob([PCM_WORKLET_SOURCE], { type: 'application/javascript' }));
+
+// Frames are coalesced for up to 40 ms so the socket sends one message per batch instead of one per 20 ms frame
+const FRAME_FLUSH_MS = 40;
+// Frames are copied into one reusable buffer; it only grows when timers are throttled (e.g. a background tab)
+let pendingBatch = new Int16Array(320 * 8);
+let pendingLength = 0;
+let flushTimer = null;
+
+function queueFrame(frame) {
+    const samples = new Int16Array(frame);
+    if (pendingLength + samples.length > pendingBatch.length) {
+        const grown = new Int16Array(Math.max(pendingBatch.length * 2, pendingLength + samples.length));
+        grown.set(pendingBatch.subarray(0, pendingLength));
+        pendingBatch = grown;
+    }
+    pendingBatch.set(samples, pendingLength);
+    pendingLength += samples.length;
+    if (flushTimer === null) {
+        flushTimer = setTimeout(flushFrames, FRAME_FLUSH_MS);
+    }
+}
+
+function flushFrames() {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+    if (!pendingLength) return;
+
+    // socket.io may buffer the packet, so it gets its own copy of the batch
+    const batch = pendingBatch.slice(0, pendingLength);
+    pendingLength = 0;
+    if (socket) {
+        socket.emit('audio_frames', batch.buffer);
+    }
+}
+
+// Initialize WebSocket connection
+function initWebSocket() {
+    // One socket per page - its handlers are bound once and it reconnects on its own
+    if (socket) return;
+    // The deferred socket.io client runs before DOMContentLoaded, so io is only missing when the vendored client was not installed
+    if (typeof io === 'undefined') {
+        wsStatus.textContent = 'Unavailable ❌';
+        console.error('socket.io client failed to load');
+        return;
+    }
+    socket = io();
+
+    socket.on('connect', function() {
+        wsStatus.textContent = 'Connected ✅';
+        wsIndicator.classList.add('connected');
+        console.log('WebSocket connected');
+    });
+
+    socket.on('disconnect', function() {
+        wsStatus.textContent = 'Disconnected ❌';
+        wsIndicator.classList.remove('connected');
+        console.log('WebSocket disconnected');
+    });
+
+    socket.on('connection_status', function(data) {
+        console.log('Connection status:', data);
+        if (data.real_connection) {
+            wsStatus.textContent = 'Connected (Real) ✅';
+        }
+    });
+
+    socket.on('transcription_result', function(data) {
+        liveResultTime.textContent = '📝 ' + new Date().toLocaleTimeString() + ':';
+        liveResultText.textContent = data.text;
+        liveResultLanguage.textContent = 'Language: ' + data.language;
+        liveResult.replaceChildren(liveResultTime, liveResultText, liveResultLanguage);
+    });
+
+    socket.on('transcription_error', function(data) {
+        liveResultError.textContent = '❌ Error: ' + data.error;
+        liveResult.replaceChildren(liveResultError);
+    });
+}
+
+// Initialize audio devices with better error handling and HTTPS detection
+async function initAudioDevices() {
+    try {
+        // Check for HTTPS requirement first
+        if (location.protocol !== 'https:' && location.hostname !== 'localhost' && location.hostname !== '127.0.0.1') {
+            throw new Error('Microphone access requires HTTPS. Please use https:// or access via localhost.');
+        }
+
+        // Check if getUserMedia is available
+        if (!navigator.mediaDevices || !navigator.mediaDevices.getUserMedia) {
+            throw new Error('getUserMedia not supported. Please use a modern browser with HTTPS.');
+        }
+
+        // Request microphone permission first to get device labels
+        try {
+            const permissionStream = await navigator.mediaDevices.getUserMedia({ audio: true });
+            // Stop the stream immediately - we just needed permission
+            permissionStream.getTracks().forEach(track => track.stop());
+        } catch (permError) {
+            console.warn('Microphone permission not granted, device labels may be limited');
+        }
+
+        // Now enumerate devices
+        const devices = await navigator.mediaDevices.enumerateDevices();
+        const audioDevices = devices.filter(device => device.kind === 'audioinput');
+        const select = deviceSelect;
+
+        // Clear existing options except the first one
+        while (select.children.length > 1) {
+            select.removeChild(select.lastChild);
+        }
+
+        if (audioDevices.length === 0) {
+            throw new Error('No audio input devices found');
+        }
+
+        audioDevices.forEach((device, index) => {
+            const option = document.createElement('option');
+            option.value = device.deviceId;
+            option.textContent = device.label || `Microphone ${index + 1}`;
+            select.appendChild(option);
+        });
+
+        console.log(`✅ Found ${audioDevices.length} audio input devices`);
+        liveResult.textContent = 
+            `✅ Found ${audioDevices.length} microphone(s). Ready for speech recognition...`;
+
+    } catch (error) {
+        console.error('Error accessing audio devices:', error);
+        liveResult.innerHTML = 
+            `<span style="color: #ff6b6b;">❌ Microphone Error: ${error.message}<br>` +
+            `<small>Please allow microphone access and ensure you are using HTTPS.</small></span>`;
+    }
+}
+
+// Recording controls are written together in one animation frame; quick start/stop clicks only render the last state
+let pendingRecordingState = false;
+let recordingFrame = null;
+
+function renderRecordingState(recording) {
+    pendingRecordingState = recording;
+    if (recordingFrame === null) {
+        recordingFrame = requestAnimationFrame(function() {
+            recordingFrame = null;
+            startBtn.disabled = pendingRecordingState;
+            stopBtn.disabled = !pendingRecordingState;
+            recordingIndicator.style.display = pendingRecordingState ? 'block' : 'none';
+        });
+    }
+}
+
+// Start recording function with better error handling
+async function startRecording() {
+    try {
+        // Check for HTTPS requirement
+        if (location.protocol !== 'https:' && location.hostname !== 'localhost' && location.hostname !== '127.0.0.1') {
+            throw new Error('Microphone access requires HTTPS. Please use https:// or access via localhost.');
+        }
+
+        const deviceId = deviceSelect.value;
+        const constraints = {
+            audio: deviceId ? { deviceId: { exact: deviceId } } : true
+        };
+
+        micStream = await navigator.mediaDevices.getUserMedia(constraints);
+        // A 16 kHz context lets the browser resample with its own filters; Firefox refuses
+        // to connect a microphone to a context at another rate, so fall back to the default
+        audioContext = null;
+        try {
+            audioContext = new AudioContext({ sampleRate: 16000 });
+            micSource = audioContext.createMediaStreamSource(micStream);
+        } catch (error) {
+            if (audioContext) audioContext.close();
+            audioContext = new AudioContext();
+            micSource = audioContext.createMediaStreamSource(micStream);
+        }
+        await audioContext.audioWorklet.addModule(pcmWorkletUrl);
+        captureNode = new AudioWorkletNode(audioContext, 'pcm-capture');
+
+        // Frames stream to the server while recording; it transcribes them on stop_recording
+        captureNode.port.onmessage = function(event) {
+            if (isRecording) {
+                queueFrame(event.data);
+            }
+        };
+
+        // Emit start recording event before the first frame
+        if (socket) {
+            socket.emit('start_recording', {
+                language: languageSelect.value
+            });
+        }
+
+        micSource.connect(captureNode);
+        captureNode.connect(audioContext.destination);
+        isRecording = true;
+
+        // Update UI
+        renderRecordingState(true);
+
+    } catch (error) {
+        console.error('Error starting recording:', error);
+        liveResult.innerHTML = 
+            '<span style="color: #ff6b6b;">❌ Microphone Error: ' + error.message + 
+            '<br><small>Please allow microphone access and ensure you are using HTTPS.</small></span>';
+    }
+}
+
+// Stop recording function
+function stopRecording() {
+    if (captureNode && isRecording) {
+        isRecording = false;
+        micSource.disconnect();
+        captureNode.disconnect();
+        audioContext.close();
+
+        // Stop all tracks
+        micStream.getTracks().forEach(track => track.stop());
+
+        // Update UI
+        renderRecordingState(false);
+
+        // Send the frames still queued, then emit stop recording event
+        flushFrames();
+        if (socket) {
+            socket.emit('stop_recording', {});
+        }
+    }
+}
+
+// File upload functionality
+function uploadFile() {
+    const fileInput = document.getElementById('audioFile');
+    const uploadModelSelect = document.getElementById('uploadModelSelect');
+    const file = fileInput.files[0];
+
+    if (!file) {
+        alert('Please select an audio file first!');
+        return;
+    }
+
+    const formData = new FormData();
+    formData.append('audio', file);
+
+    // Add selected model to form data (if different from current)
+    if (uploadModelSelect && uploadModelSelect.value) {
+        formData.append('model', uploadModelSelect.value);
+    }
+
+    uploadResult.textContent = '🔄 Processing with ' + (uploadModelSelect ? uploadModelSelect.value : 'current') + ' model...';
+    uploadBtn.disabled = true;
+
+    fetch('/transcribe', {
+        method: 'POST',
+        body: formData
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.error) {
+            uploadResult.innerHTML = 
+                '<span style="color: #ff6b6b;">❌ Error: ' + data.error + '</span>';
+        } else {
+            uploadResult.innerHTML = 
+                '<strong>📝 Transcription:</strong><br>' + data.text + 
+                '<br><small>Language: ' + (data.language || 'unknown') + 
+                ' | Model: ' + (data.model_used || 'unknown') + '</small>';
+        }
+        uploadBtn.disabled = false;
+    })
+    .catch(error => {
+        uploadResult.innerHTML = 
+            '<span style="color: #ff6b6b;">❌ Error: ' + error.message + '</span>';
+        uploadBtn.disabled = false;
+    });
+}
+
+// Clear upload
+function clearUpload() {
+    document.getElementById('audioFile').value = '';
+    uploadResult.textContent = 'No file uploaded yet...';
+    uploadBtn.disabled = true;
+}
+
+// Initialize everything when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    const fileInput = document.getElementById('audioFile');
+    const modelSelect = document.getElementById('modelSelect');
+
+    // Initialize model management
+    loadModels();
+
+    // Model selection change handler
+    if (modelSelect) {
+        modelSelect.addEventListener('change', function() {
+            const selectedModel = this.value;
+            if (selectedModel) {
+                switchModel(selectedModel);
+            }
+        });
+    }
+
+    fileInput.addEventListener('change', function() {
+        const file = this.files[0];
+        uploadBtn.disabled = !file;
+
+        // Show selected file info
+        if (file) {
+            const fileSizeMB = (file.size / (1024 * 1024)).toFixed(2);
+            uploadResult.innerHTML = 
+                `📁 <strong>Selected File:</strong> ${file.name}<br>` +
+                `📊 <strong>Size:</strong> ${fileSizeMB} MB<br>` +
+                `🎵 <strong>Type:</strong> ${file.type}<br>` +
+                `<small>Ready to upload and transcribe...</small>`;
+        } else {
+            uploadResult.textContent = 'No file uploaded yet...';
+        }
+    });
+
+    // Drag and drop functionality
+    const uploadArea = document.getElementById('uploadArea');
+
+    uploadArea.addEventListener('dragover', function(e) {
+        e.preventDefault();
+        this.classList.add('dragover');
+    });
+
+    uploadArea.addEventListener('dragleave', function(e) {
+        e.preventDefault();
+        this.classList.remove('dragover');
+    });
+
+    uploadArea.addEventListener('drop', function(e) {
+        e.preventDefault();
+        this.classList.remove('dragover');
+
+        const files = e.dataTransfer.files;
+        if (files.length > 0) {
+            fileInput.files = files;
+            uploadBtn.disabled = false;
+
+            // Show dropped file info
+            const file = files[0];
+            const fileSizeMB = (file.size / (1024 * 1024)).toFixed(2);
+            uploadResult.innerHTML = 
+                `📁 <strong>Dropped File:</strong> ${file.name}<br>` +
+                `📊 <strong>Size:</strong> ${fileSizeMB} MB<br>` +
+                `🎵 <strong>Type:</strong> ${file.type}<br>` +
+                `<small>Ready to upload and transcribe...</small>`;
+        }
+    });
+
+    // Initialize everything
+    initWebSocket();
+    initAudioDevices();
+});
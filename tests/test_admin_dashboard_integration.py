@@ -1,10 +1,13 @@
 import pytest
-from flask import url_for
+from flask import Flask, url_for
 import datetime
+import threading
 
 # Import the CommunicationLog that will be used by the app context
 # This ensures we are using the same class that the app uses.
-from admin import CommunicationLog
+from admin import CommunicationLog, create_admin_blueprint
+from admin.admin_panel import AdminPanel
+from modules.system_stats import SystemStats
 
 
 def test_dashboard_shows_no_logs_message(client, app): # Added app fixture
@@ -125,3 +128,23 @@ def test_dashboard_handles_malformed_log_file(client, app, communication_log_ins
 # It might be useful to also test with a very large number of logs if pagination
 # were implemented, or to ensure performance doesn't degrade significantly.
 # For now, this covers basic display and data handling.
+
+
+def test_increment_transcription_count_is_thread_safe():
+    """Concurrent increments must not lose updates, whether stats are a SystemStats or a plain dict."""
+    for stats_type in (SystemStats, dict):
+        stats = stats_type(total_transcriptions=0, transcriptions_by_source={"live": 0, "upload": 0, "api": 0})
+        panel = AdminPanel(Flask(__name__), create_admin_blueprint(), system_stats=stats)
+
+        def worker():
+            for _ in range(1000):
+                panel.increment_transcription_count("live")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert stats["total_transcriptions"] == 4000
+        assert stats["transcriptions_by_source"]["live"] == 4000
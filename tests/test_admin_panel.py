@@ -0,0 +1,212 @@
+import gzip
+import time
+
+from flask import Flask
+
+from modules.admin_panel import AdminPanel, format_uptime, minify_css, minify_html, render_download_status_rows, render_nav
+
+
+class FakeModelManager:
+    AVAILABLE_MODELS = {"base": {"name": "Base", "size": "~74 MB", "speed": "Fast", "quality": "Good", "description": "Base"}}
+    downloaded_models = {"base"}
+
+    def get_current_model_name(self):
+        return "base"
+
+    def get_available_models(self):
+        return self.AVAILABLE_MODELS
+
+    def is_model_loading(self):
+        return False
+
+
+class FakeChatHistory:
+    def get_statistics(self):
+        return {"total_transcriptions": 3, "source_breakdown": {"upload": 3}, "model_breakdown": {"base": 3}}
+
+
+def make_panel():
+    system_stats = {"uptime_start_monotonic": time.monotonic(), "total_transcriptions": 7}
+    return AdminPanel(True, system_stats, ["client-1"], FakeModelManager(), FakeChatHistory())
+
+
+def test_admin_interface_fills_dynamic_fields():
+    """Test that the admin page renders the current stats into the static skeleton."""
+    app = Flask(__name__)
+    make_panel().register_routes(app)
+
+    response = app.test_client().get("/admin")
+    html = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.content_type == "text/html; charset=utf-8"
+    assert response.content_length == len(response.data)
+    assert "✅ Online" in html
+    assert '<select id="admin-model-select" style="margin-left: 10px; padding: 5px;">' in html
+    assert "📦 Downloaded" in html
+    assert "<li>upload: 3 transcriptions</li>" in html
+    assert '<script src="/static/admin.js?v=' in html
+    assert '<a href="/admin" class="nav-link active">' in html
+
+
+def test_admin_js_is_served_as_static_asset():
+    """Test that the admin script is served separately with long-lived caching."""
+    app = Flask(__name__)
+    make_panel().register_routes(app)
+
+    response = app.test_client().get("/static/admin.js")
+    assert response.status_code == 200
+    assert response.mimetype == "text/javascript"
+    assert response.cache_control.max_age == 86400
+    assert "${date}" in response.get_data(as_text=True)
+    assert "progressBar.style.width = '100%';" in response.get_data(as_text=True)
+
+
+def test_admin_interface_without_current_model():
+    """Test that a model manager without a current model still renders the page."""
+    panel = make_panel()
+    panel.model_manager.get_current_model_name = lambda: None
+
+    assert "<td>Model Type</td><td>Not loaded</td>" in panel.get_admin_interface().decode("utf-8")
+
+
+def test_admin_interface_escapes_stored_names():
+    """Test that names coming from stored history are HTML-escaped."""
+    panel = make_panel()
+    panel.chat_history.get_statistics = lambda: {"model_breakdown": {"<b>x</b>": 1}}
+
+    assert "<li>&lt;b&gt;x&lt;/b&gt;: 1 transcriptions</li>" in panel.get_admin_interface().decode("utf-8")
+
+
+def test_admin_css_is_served_with_etag():
+    """Test that the admin stylesheet is linked and revalidates with a 304."""
+    app = Flask(__name__)
+    make_panel().register_routes(app)
+    client = app.test_client()
+
+    assert '<link rel="stylesheet" href="/static/admin.css?v=' in client.get("/admin").get_data(as_text=True)
+    response = client.get("/static/admin.css")
+    assert response.status_code == 200
+    assert response.mimetype == "text/css"
+    assert "/*" not in response.get_data(as_text=True)
+    assert "\n" not in response.get_data(as_text=True)
+
+    cached = client.get("/static/admin.css", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+
+
+def test_admin_page_is_gzipped_when_accepted():
+    """Test that clients accepting gzip get the precompressed page and stylesheet."""
+    app = Flask(__name__)
+    make_panel().register_routes(app)
+    client = app.test_client()
+
+    plain = client.get("/admin")
+    response = client.get("/admin", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert gzip.decompress(response.data) == plain.data
+
+    css = client.get("/static/admin.css", headers={"Accept-Encoding": "gzip"})
+    assert css.headers["Content-Encoding"] == "gzip"
+    assert css.headers["ETag"] != client.get("/static/admin.css").headers["ETag"]
+
+
+def test_admin_page_revalidates_with_etag():
+    """Test that an unchanged admin page is answered with 304 Not Modified."""
+    app = Flask(__name__)
+    make_panel().register_routes(app)
+    client = app.test_client()
+
+    response = client.get("/admin")
+    assert response.cache_control.no_cache
+    assert client.get("/admin", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+
+
+def test_admin_page_is_reused_until_stats_change():
+    """Test that repeated renders share one encoded page until a counter changes."""
+    panel = make_panel()
+    first = panel._get_rendered_page()
+
+    assert panel._get_rendered_page() is first
+
+    panel.system_stats["total_transcriptions"] += 1
+    assert panel._get_rendered_page() is not first
+
+
+def test_admin_page_is_rerendered_when_downloads_or_history_change():
+    """Test that new downloads and chat history writes invalidate the cached page."""
+    panel = make_panel()
+    panel.model_manager.downloaded_models = set()
+    panel.chat_history.change_count = 0
+    first = panel._get_rendered_page()
+    assert "⬇️ Need Download" in first[0].decode("utf-8")
+
+    panel.model_manager.downloaded_models = {"base"}
+    second = panel._get_rendered_page()
+    assert "📦 Downloaded" in second[0].decode("utf-8")
+    assert second[2] != first[2]
+
+    panel.chat_history.change_count += 1
+    assert panel._get_rendered_page() is not second
+
+
+def test_admin_page_etag_ignores_uptime():
+    """Test that uptime is left to the stats poller so the page ETag stays stable."""
+    panel = make_panel()
+    first = panel._get_rendered_page()
+
+    panel.system_stats["uptime_start_monotonic"] -= 3600
+    assert panel._get_rendered_page()[2] == first[2]
+    assert 'id="stat-uptime">…<' in first[0].decode("utf-8")
+
+
+def test_admin_stats_endpoint_returns_stat_cards():
+    """Test that the stats poller endpoint returns the live stat card values."""
+    app = Flask(__name__)
+    make_panel().register_routes(app)
+    client = app.test_client()
+
+    assert 'http-equiv="refresh"' not in client.get("/admin").get_data(as_text=True)
+    data = client.get("/api/admin/stats").get_json()
+    assert data == {"online": True, "status": "✅ Online", "uptime": "0h 0m 0s", "total": 7, "clients": 1}
+
+
+def test_render_nav_marks_only_the_active_page():
+    """Test that the shared navigation header highlights exactly one link."""
+    nav = render_nav("docs")
+
+    assert '<a href="/docs" class="nav-link active">' in nav
+    assert nav.count(" active") == 1
+    assert render_nav("docs") is nav
+
+
+def test_format_uptime():
+    """Test that uptime seconds are split into hours, minutes and seconds."""
+    assert format_uptime(3 * 3600 + 25 * 60 + 7) == "3h 25m 7s"
+    assert format_uptime(59) == "0h 0m 59s"
+
+
+def test_admin_page_needs_no_jinja():
+    """Test that the admin page has no template syntax left for Jinja to process."""
+    html = make_panel().get_admin_interface().decode("utf-8")
+
+    assert "{{" not in html and "{%" not in html
+
+
+def test_minifiers_strip_comments_and_indentation():
+    """Test that minification removes comments and indentation but keeps line breaks."""
+    assert minify_css("/* nav */\n  .a {\n    color: red;\n  }\n") == ".a { color: red; }"
+    assert minify_html("<div>\n    <!-- note -->\n    <span>x</span>\n</div>") == "<div>\n<span>x</span>\n</div>"
+
+
+def test_download_status_rows_are_reused_until_downloads_change():
+    """Test that the download status fragment is cached per model list and download set."""
+    models = (("tiny", "Tiny", "<39 MB>", "<fast>"),)
+    rows = render_download_status_rows(models, frozenset())
+
+    assert "⬇️ Need Download" in rows
+    assert "&lt;39 MB&gt;" in rows
+    assert "&lt;fast&gt;" in rows
+    assert render_download_status_rows(models, frozenset()) is rows
+    assert "📦 Downloaded" in render_download_status_rows(models, frozenset({"tiny"}))
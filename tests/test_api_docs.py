@@ -0,0 +1,29 @@
+from flask import Flask
+
+from modules.api_docs import APIDocs
+
+
+def test_openapi_spec_is_served_with_etag_and_revalidates():
+    """Test that the spec is served pre-serialized and a matching ETag yields 304."""
+    app = Flask(__name__)
+    APIDocs(version="0.10.0").register_routes(app)
+    client = app.test_client()
+
+    response = client.get("/api/openapi.json")
+    assert response.status_code == 200
+    assert response.json["info"]["version"] == "0.10.0"
+    assert response.headers["ETag"]
+
+    cached = client.get("/api/openapi.json", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+
+
+def test_openapi_spec_uses_request_base_url():
+    """Test that each host gets a spec pointing at its own base URL."""
+    app = Flask(__name__)
+    APIDocs().register_routes(app)
+    client = app.test_client()
+
+    response = client.get("/api/openapi.json", base_url="https://appliance.local:5001")
+
+    assert response.json["servers"][0]["url"] == "https://appliance.local:5001"
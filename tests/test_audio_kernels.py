@@ -0,0 +1,50 @@
+import io
+import wave
+
+import numpy as np
+
+from modules.audio_kernels import decode_pcm16_wav, high_pass, int16_to_float32, rms
+
+
+def _make_wav(samples, sample_rate=16000, channels=1):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(samples.astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def test_int16_to_float32_scales_to_unit_range():
+    """Test that PCM samples are normalized to float32 in [-1.0, 1.0)."""
+    out = int16_to_float32(np.array([-32768, 0, 16384], dtype=np.int16))
+
+    assert out.dtype == np.float32
+    assert np.allclose(out, [-1.0, 0.0, 0.5])
+
+
+def test_decode_pcm16_wav_returns_samples_for_whisper_format():
+    """Test that 16 kHz mono PCM WAV chunks are decoded in-process."""
+    samples = decode_pcm16_wav(_make_wav(np.full(1600, 8192, dtype=np.int16)))
+
+    assert samples.shape == (1600,)
+    assert abs(rms(samples) - 0.25) < 1e-6
+
+
+def test_decode_pcm16_wav_rejects_other_formats():
+    """Test that non-WAV or resampling-required audio falls back to ffmpeg."""
+    assert decode_pcm16_wav(b"\x1aE\xdf\xa3webm-data") is None
+    assert decode_pcm16_wav(_make_wav(np.zeros(100, dtype=np.int16), sample_rate=44100)) is None
+
+
+def test_high_pass_removes_dc_and_keeps_speech_band():
+    """Test that a DC offset is removed while a 1 kHz tone passes almost unchanged."""
+    t = np.arange(16000) / 16000
+    tone = (0.25 * np.sin(2 * np.pi * 1000 * t)).astype(np.float32)
+
+    filtered = high_pass(tone + np.float32(0.5))
+
+    assert filtered.dtype == np.float32
+    assert abs(float(np.mean(filtered))) < 1e-3
+    assert abs(rms(filtered) - rms(tone)) < 0.05 * rms(tone)
@@ -0,0 +1,43 @@
+import json
+
+from modules.chat_history import ChatHistoryManager
+
+
+def test_chat_history_json_is_cached_until_next_write(tmp_path):
+    """Test that the serialized payload is reused and refreshed after an insert."""
+    manager = ChatHistoryManager(db_path=str(tmp_path / "chat_history.db"))
+    manager.add_transcription("first", source_type="upload")
+
+    blob = manager.get_recent_transcriptions_json(10)
+    assert manager.get_recent_transcriptions_json(10) is blob
+    assert json.loads(blob)["count"] == 1
+
+    manager.add_transcription("second", source_type="live")
+    payload = json.loads(manager.get_recent_transcriptions_json(10))
+
+    assert payload["count"] == 2
+    assert payload["status"] == "success"
+
+
+def test_chat_history_json_filters_by_source(tmp_path):
+    """Test that the source filter is part of the cache key."""
+    manager = ChatHistoryManager(db_path=str(tmp_path / "chat_history.db"))
+    manager.add_transcription("upload text", source_type="upload")
+    manager.add_transcription("live text", source_type="live")
+
+    assert json.loads(manager.get_recent_transcriptions_json(10))["count"] == 2
+    payload = json.loads(manager.get_recent_transcriptions_json(10, "live"))
+
+    assert [t["text"] for t in payload["transcriptions"]] == ["live text"]
+
+
+def test_chat_history_change_count_tracks_writes(tmp_path):
+    """Test that every write bumps the change counter used by cached views."""
+    manager = ChatHistoryManager(db_path=str(tmp_path / "chat_history.db"))
+    before = manager.change_count
+
+    transcription_id = manager.add_transcription("text", source_type="upload")
+    manager.update_transcription(transcription_id, "edited")
+    manager.delete_transcription(transcription_id)
+
+    assert manager.change_count == before + 3
@@ -0,0 +1,187 @@
+import base64
+import io
+import wave
+
+import numpy as np
+from flask import Flask
+from flask_socketio import SocketIO
+
+from modules import live_speech
+from modules.live_speech import LiveSpeechHandler
+from modules.system_stats import SystemStats
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append((audio, options))
+        return {"text": "hello", "language": options.get("language", "en")}
+
+
+class FakeModelManager:
+    def __init__(self, model):
+        self.model = model
+
+    def get_model(self):
+        return self.model
+
+    def get_current_model_name(self):
+        return "base"
+
+
+class FakeChatHistory:
+    def __init__(self):
+        self.entries = []
+
+    def add_transcription(self, **entry):
+        self.entries.append(entry)
+
+
+def make_client(model):
+    app = Flask(__name__)
+    socketio = SocketIO(app)
+    handler = LiveSpeechHandler(FakeModelManager(model), True, SystemStats(total_transcriptions=0), [], FakeChatHistory())
+    socketio.on_event("connect", handler.handle_connect)
+    socketio.on_event("audio_chunk", handler.handle_audio_chunk)
+    socketio.on_event("audio_frames", handler.handle_audio_frames)
+    socketio.on_event("start_recording", handler.handle_start_recording)
+    socketio.on_event("stop_recording", handler.handle_stop_recording)
+    return socketio.test_client(app), handler
+
+
+def test_streamed_frames_are_transcribed_on_stop():
+    """Test that PCM frames sent between start and stop are transcribed as one recording."""
+    model = FakeModel()
+    client, handler = make_client(model)
+    frame = np.full(320, 8192, dtype="<i2").tobytes()
+
+    client.emit("start_recording", {"language": "de"})
+    for _ in range(50):
+        client.emit("audio_frames", frame)
+    client.emit("stop_recording", {})
+
+    results = [event["args"][0] for event in client.get_received() if event["name"] == "transcription_result"]
+    assert results[0]["text"] == "hello"
+    audio, options = model.calls[0]
+    assert audio.shape == (16000,)
+    assert options["language"] == "de"
+    assert handler.system_stats["total_transcriptions"] == 1
+    assert handler._recordings == {}
+
+
+def test_recording_limit_is_reported_once(monkeypatch):
+    """Test that frames past the recording cap are dropped with a single error to the client."""
+    monkeypatch.setattr(live_speech, "MAX_RECORDING_BYTES", 1000)
+    model = FakeModel()
+    client, handler = make_client(model)
+    frame = np.full(320, 8192, dtype="<i2").tobytes()
+
+    client.emit("start_recording", {"language": "de"})
+    for _ in range(3):
+        client.emit("audio_frames", frame)
+
+    errors = [event for event in client.get_received() if event["name"] == "transcription_error"]
+    assert len(errors) == 1
+    ((_, pcm),) = handler._recordings.values()
+    assert len(pcm) == 1000
+
+
+def test_long_recordings_bypass_the_batcher():
+    """Test that only clips that fit one Whisper window are queued for batching."""
+
+    class RejectingBatcher:
+        result_timeout = 5
+
+        def submit(self, audio, **options):
+            raise AssertionError("long recording was queued for batching")
+
+    model = FakeModel()
+    client, handler = make_client(model)
+    handler.batcher = RejectingBatcher()
+    frame = np.full(16000, 8192, dtype="<i2").tobytes()
+
+    client.emit("start_recording", {"language": "de"})
+    for _ in range(31):
+        client.emit("audio_frames", frame)
+    client.emit("stop_recording", {})
+
+    assert model.calls[0][0].shape == (31 * 16000,)
+
+
+def test_silence_gate_is_opt_in():
+    """Test that quiet chunks reach Whisper unless a silence threshold is configured."""
+    model = FakeModel()
+    client, handler = make_client(model)
+    quiet = np.zeros(16000, dtype="<i2").tobytes()
+
+    client.emit("start_recording", {})
+    client.emit("audio_frames", quiet)
+    client.emit("stop_recording", {})
+    assert len(model.calls) == 1
+
+    handler.silence_rms_threshold = 0.005
+    client.emit("start_recording", {})
+    client.emit("audio_frames", quiet)
+    client.emit("stop_recording", {})
+    assert len(model.calls) == 1
+    results = [event["args"][0] for event in client.get_received() if event["name"] == "transcription_result"]
+    assert results[-1]["silence"] is True
+
+
+def test_frames_outside_a_recording_are_ignored():
+    """Test that frames without a start_recording are dropped."""
+    model = FakeModel()
+    client, _ = make_client(model)
+
+    client.emit("audio_frames", np.zeros(320, dtype="<i2").tobytes())
+    client.emit("stop_recording", {})
+
+    assert model.calls == []
+
+
+def test_binary_wav_chunk_is_transcribed():
+    """Test that a 16 kHz PCM WAV chunk sent as a binary attachment is transcribed."""
+    model = FakeModel()
+    client, _ = make_client(model)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(np.full(16000, 8192, dtype="<i2").tobytes())
+
+    client.emit("audio_chunk", {"audio_data": buffer.getvalue(), "language": "en"})
+
+    assert [event["name"] for event in client.get_received()][-1] == "transcription_result"
+    assert model.calls[0][0].shape == (16000,)
+
+
+def test_base64_chunk_is_still_transcribed():
+    """Test that base64 strings from older clients are decoded like binary chunks."""
+    model = FakeModel()
+    client, _ = make_client(model)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(np.full(16000, 8192, dtype="<i2").tobytes())
+
+    client.emit("audio_chunk", {"audio_data": base64.b64encode(buffer.getvalue()).decode("ascii")})
+
+    assert [event["name"] for event in client.get_received()][-1] == "transcription_result"
+    assert model.calls[0][0].shape == (16000,)
+
+
+def test_malformed_chunk_is_rejected():
+    """Test that payloads that are neither binary nor base64 get an error instead of a transcription."""
+    model = FakeModel()
+    client, _ = make_client(model)
+
+    client.emit("audio_chunk", {"audio_data": "not base64!"})
+
+    errors = [event["args"][0] for event in client.get_received() if event["name"] == "transcription_error"]
+    assert errors == [{"error": "Audio data must be binary or base64 encoded"}]
+    assert model.calls == []
@@ -0,0 +1,46 @@
+import main_clean
+
+
+def test_main_clean_registers_upload_routes():
+    """Test that main_clean imports and wires the upload endpoints."""
+    rules = {rule.rule for rule in main_clean.app.url_map.iter_rules()}
+
+    assert {"/transcribe", "/api/transcribe-live", "/health", "/admin"} <= rules
+
+
+def test_main_clean_registers_live_speech_events_once():
+    """Test that live speech events exist before the handler is built."""
+    events = set(main_clean.socketio.server.handlers["/"])
+
+    assert {"audio_chunk", "audio_frames", "start_recording", "stop_recording"} <= events
+
+
+def test_main_clean_builds_live_speech_handler_on_connect():
+    """Test that the live speech handler is created lazily by the first client."""
+    client = main_clean.socketio.test_client(main_clean.app)
+    try:
+        assert client.is_connected()
+        assert main_clean.live_speech_handler is not None
+        assert any(message["name"] == "connection_status" for message in client.get_received())
+    finally:
+        client.disconnect()
+
+
+def test_main_clean_serves_landing_page_from_memory():
+    """Test that the pre-rendered landing page revalidates and honours gzip."""
+    client = main_clean.app.test_client()
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+
+    cached = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+
+
+def test_main_clean_landing_page_loads_socketio_same_origin():
+    """Test that the landing page pulls the Socket.IO client from the appliance, not a CDN."""
+    response = main_clean.app.test_client().get("/")
+
+    assert b'src="/static/socket.io.min.js"' in response.data
+    assert b"cdnjs" not in response.data
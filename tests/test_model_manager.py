@@ -0,0 +1,66 @@
+import pytest
+
+from modules.model_manager import FasterWhisperModel, ModelManager
+
+
+class FakeSegment:
+    start = 0.0
+    end = 1.0
+    text = " hello"
+
+
+class FakeInfo:
+    language = "de"
+
+
+class FakeWhisperModel:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append(options)
+        return iter([FakeSegment()]), FakeInfo()
+
+
+def make_faster_model():
+    model = FasterWhisperModel.__new__(FasterWhisperModel)
+    model.compute_type = "int8"
+    model.model = FakeWhisperModel()
+    return model
+
+
+def test_faster_whisper_maps_transcribe_options():
+    """Test that openai-whisper options reach faster-whisper under its own names."""
+    model = make_faster_model()
+
+    result = model.transcribe(
+        "clip.wav", language="de", task="translate", initial_prompt="Hi", logprob_threshold=-1.0, fp16=False
+    )
+
+    assert result["text"] == " hello"
+    assert model.model.calls == [{"language": "de", "task": "translate", "initial_prompt": "Hi", "log_prob_threshold": -1.0}]
+
+
+def test_faster_whisper_rejects_unsupported_options():
+    """Test that options faster-whisper cannot honour raise instead of being dropped."""
+    with pytest.raises(TypeError, match="clip_timestamps"):
+        make_faster_model().transcribe("clip.wav", clip_timestamps="0")
+
+
+def test_quantization_is_opt_in():
+    """Test that the model manager keeps openai-whisper unless quantization is requested."""
+    assert ModelManager().quantization is None
+
+
+def test_download_check_finds_faster_whisper_models(tmp_path):
+    """Test that CTranslate2 models in the hub cache layout count as downloaded."""
+    snapshot = tmp_path / "models--Systran--faster-whisper-large-v3" / "snapshots" / "abc123"
+    snapshot.mkdir(parents=True)
+    (snapshot / "model.bin").write_bytes(b"")
+    (tmp_path / "tiny.pt").write_bytes(b"")
+
+    manager = ModelManager(cache_dir=str(tmp_path), quantization="int8")
+    manager.whisper_available = True
+    manager._check_downloaded_models()
+
+    assert manager.downloaded_models == {"large", "tiny"}
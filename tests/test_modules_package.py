@@ -0,0 +1,56 @@
+import json
+import sys
+import threading
+
+import modules
+
+
+def test_availability_flags_are_plain_bools():
+    """Test that optional subsystem flags resolve to real booleans on first access."""
+    assert modules.UPDATE_MANAGER_AVAILABLE is True
+    assert modules.LEGACY_UPDATE_CONFIG_AVAILABLE is False
+    assert modules.ENTERPRISE_MAINTENANCE_AVAILABLE is modules.MAINTENANCE_MANAGER_AVAILABLE
+    assert json.dumps({"update": modules.UPDATE_MANAGER_AVAILABLE}) == '{"update": true}'
+
+
+def test_availability_flags_fail_when_import_breaks(monkeypatch):
+    """Test that a subpackage that exists but cannot be imported is reported unavailable."""
+
+    def broken_import(name, package=None):
+        raise ImportError(f"broken dependency in {name}")
+
+    monkeypatch.setattr(modules.importlib, "import_module", broken_import)
+
+    assert modules._probe(".update") is False
+
+
+def test_lazy_exports_resolve_on_access():
+    """Test that lazily exported names import their submodule and are cached."""
+    cache_class = modules.TranscriptionCache
+
+    assert "modules.transcription_cache" in sys.modules
+    assert modules.__dict__["TranscriptionCache"] is cache_class
+    assert modules.UpdateConfig is None
+
+
+def test_wildcard_import_brings_in_classes():
+    """Test that `from modules import *` still exports the classes alongside the flags."""
+    namespace = {}
+    exec("from modules import *", namespace)
+
+    assert namespace["UploadHandler"] is modules.UploadHandler
+    assert "UPDATE_MANAGER_AVAILABLE" in namespace
+    assert set(modules.__all__) <= set(modules._LAZY) | set(modules._ALIASES) | set(vars(modules))
+
+
+def test_version_is_a_plain_constant():
+    """Test that __version__ is available without any lookup."""
+    assert modules.__version__ == "0.10.0"
+
+
+def test_package_import_does_not_start_warmup_thread():
+    """Test that warming heavy submodules is left to server entry points."""
+    assert not any(thread.name == "modules-warmup" for thread in threading.enumerate())
+
+    modules.warm_modules_in_background().join(timeout=30)
+    assert "modules.upload_handler" in sys.modules
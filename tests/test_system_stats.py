@@ -0,0 +1,28 @@
+import threading
+
+from modules.system_stats import SystemStats
+
+
+def test_increment_is_atomic_across_threads():
+    """Test that concurrent increments from several threads are not lost."""
+    stats = SystemStats(total_transcriptions=0)
+
+    def worker():
+        for _ in range(1000):
+            stats.increment("total_transcriptions")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stats["total_transcriptions"] == 8000
+
+
+def test_increment_starts_missing_counters_at_zero():
+    """Test that incrementing an unknown key creates it."""
+    stats = SystemStats()
+
+    assert stats.increment("uploads", 2) == 2
+    assert stats["uploads"] == 2
@@ -0,0 +1,95 @@
+from concurrent.futures import Future
+
+from modules.transcription_batcher import TranscriptionBatcher
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append((audio, options))
+        if audio == "broken.wav":
+            raise RuntimeError("decode failed")
+        return {"text": f"text of {audio}", "language": options.get("language", "en")}
+
+
+class FakeModelManager:
+    whisper = None
+
+    def __init__(self, model):
+        self.model = model
+
+    def get_model(self):
+        return self.model
+
+    def transcribe(self, audio, **options):
+        if self.model is None:
+            return None
+        try:
+            return self.model.transcribe(audio, **options)
+        except Exception:
+            return None
+
+
+def test_batcher_resolves_each_request():
+    """Test that concurrent submissions each get their own result."""
+    model = FakeModel()
+    batcher = TranscriptionBatcher(FakeModelManager(model), max_batch=4, max_wait_ms=5)
+
+    futures = [batcher.submit(f"clip{i}.wav", language="de") for i in range(6)]
+
+    assert [f.result(timeout=5)["text"] for f in futures] == [f"text of clip{i}.wav" for i in range(6)]
+    assert all(options == {"language": "de"} for _, options in model.calls)
+
+
+def test_batcher_transcribe_returns_none_on_failure():
+    """Test that failures surface as None, matching ModelManager.transcribe."""
+    batcher = TranscriptionBatcher(FakeModelManager(FakeModel()))
+
+    assert batcher.transcribe("broken.wav") is None
+    assert TranscriptionBatcher(FakeModelManager(None)).transcribe("clip.wav") is None
+
+
+class BrokenModelManager:
+    whisper = None
+
+    def get_model(self):
+        raise RuntimeError("model manager crashed")
+
+
+def test_batcher_fails_pending_futures_when_batch_crashes():
+    """Test that an unexpected worker error resolves every future in the batch."""
+    batcher = TranscriptionBatcher(BrokenModelManager(), max_batch=4, max_wait_ms=5)
+
+    futures = [batcher.submit([0.0] * 16) for _ in range(3)]
+
+    for future in futures:
+        assert isinstance(future.exception(timeout=5), RuntimeError)
+    assert batcher._worker.is_alive()
+
+
+class FakeDecodingResult:
+    def __init__(self, text, no_speech_prob=0.0, avg_logprob=-0.2, compression_ratio=1.2):
+        self.text = text
+        self.language = "en"
+        self.no_speech_prob = no_speech_prob
+        self.avg_logprob = avg_logprob
+        self.compression_ratio = compression_ratio
+
+
+def test_batched_decode_falls_back_like_transcribe():
+    """Test that batched results transcribe() would retry are re-run, and silence comes back empty."""
+    model = FakeModel()
+    batcher = TranscriptionBatcher(FakeModelManager(model))
+    results = [
+        FakeDecodingResult("clean"),
+        FakeDecodingResult("repeat repeat repeat", compression_ratio=3.0),
+        FakeDecodingResult("noise", no_speech_prob=0.9, avg_logprob=-1.5),
+    ]
+    requests = [("clip0.wav", {}, Future()), ("clip1.wav", {}, Future()), ("clip2.wav", {}, Future())]
+
+    batcher._resolve_decoded(requests, results)
+
+    assert [future.result(timeout=5)["text"] for _, _, future in requests] == ["clean", "text of clip1.wav", ""]
+    assert [audio for audio, _ in model.calls] == ["clip1.wav"]
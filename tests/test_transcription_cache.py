@@ -0,0 +1,36 @@
+from modules.transcription_cache import TranscriptionCache
+
+
+def test_cache_hit_returns_stored_text():
+    """Test that identical audio and options return the cached result."""
+    cache = TranscriptionCache()
+    key = cache.make_key(b"audio-bytes", "base", language="en")
+
+    assert cache.get(key) is None
+    cache.set(key, {"text": "hello", "language": "en", "segments": [{"id": 0}]})
+
+    assert cache.get(cache.make_key(b"audio-bytes", "base", language="en")) == {"text": "hello", "language": "en"}
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_cache_key_depends_on_model_and_options():
+    """Test that the same audio under another model or language is a different entry."""
+    key = TranscriptionCache.make_key(b"audio-bytes", "base")
+
+    assert key != TranscriptionCache.make_key(b"audio-bytes", "small")
+    assert key != TranscriptionCache.make_key(b"audio-bytes", "base", language="de")
+    assert key != TranscriptionCache.make_key(b"other-bytes", "base")
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that the cache stays bounded and evicts the oldest entry."""
+    cache = TranscriptionCache(max_entries=2)
+    cache.set("a", {"text": "a"})
+    cache.set("b", {"text": "b"})
+    cache.get("a")
+    cache.set("c", {"text": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats()["entries"] == 2